@@ -35,6 +35,7 @@ def main():
         market_hours_cfg=cfg["market_hours"],
         test_cfg=cfg["test"],
         news_cfg=cfg.get("news", {"enabled": False}),
+        batch_alerts=bool(cfg["ntfy"].get("batch_alerts", False)),
     )
 
     # TEmporäres Test-Aufruf
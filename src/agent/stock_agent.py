@@ -3,61 +3,135 @@
 #        und – falls verfügbar – ein LLM für Bewertung/Formatierung der Pushes.
 
 from __future__ import annotations
-import os, json, datetime as dt
+import os, json, asyncio, datetime as dt
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 
 from zoneinfo import ZoneInfo
 
+import requests
+
 # --- deine bestehenden Module als "Tools" ---
-from src.app.market import get_open_and_last
-from src.app.news import build_query, fetch_headlines
+from src.app.market import YF_ERRORS, get_open_and_last, get_open_and_last_batch
+from src.app.news import build_query, fetch_headlines_batch
 from src.app.ntfy import notify_ntfy
 from src.app.state import load_state, save_state
+from src.app.utils import json_dumps, json_loads
+
+# Optional: NumPy für die vektorisierte Δ%/Korridor-Stufe (sonst reine Python-Schleife)
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Optional: Company-Meta/Keywords (falls vorhanden)
 try:
-    from src.app.company import auto_keywords
-except Exception:
+    from src.app.company import auto_keywords, flush_cache, prefetch_company_meta
+except ImportError:
     auto_keywords = None  # optional
+    flush_cache = None
+    prefetch_company_meta = None
 
 # Optionaler LLM-Client (Agent). Falls nicht vorhanden, nutzen wir Fallback.
 # Du kannst hier jede Provider-Lib verwenden (OpenAI, Azure OpenAI, Groq, etc.)
 LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4o-mini")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # Secret setzen, wenn LLM aktiv sein soll
-client = None
+aclient = None  # AsyncOpenAI für run_agent_once_async
+# Fehler, bei denen wir still auf die Plain-Variante zurückfallen (API, Timeout, kaputtes JSON);
+# eine formal falsche, aber gültige Antwort fangen _llm_json/_llm_content ab, nicht das except
+_LLM_ERRORS: Tuple[type, ...] = (TimeoutError, OSError, json.JSONDecodeError)
 if OPENAI_API_KEY:
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=OPENAI_API_KEY)
-    except Exception:
-        client = None  # Fallback
+        from openai import AsyncOpenAI, OpenAIError
+        aclient = AsyncOpenAI(api_key=OPENAI_API_KEY)
+        _LLM_ERRORS = (OpenAIError,) + _LLM_ERRORS
+    except ImportError:
+        aclient = None  # Fallback
+
+# Erwartbare Fehler je Ticker (kein Kurs, Netzwerk, kaputte Daten) -> loggen und weiter;
+# alles andere ist ein Bug und bricht den Lauf nach dem Loggen ab.
+_TICKER_ERRORS: Tuple[type, ...] = (RuntimeError, requests.RequestException) + YF_ERRORS
+
+# Eine HTTP-Session für alle Pushes eines Prozesses (TCP/TLS keep-alive).
+# yfinance verwaltet seine (curl_cffi-)Session selbst und akzeptiert keine requests.Session.
+_SESSION = requests.Session()
 
 # ----------------------------- Hilfsfunktionen -----------------------------
+# ZoneInfo-Objekte einmal pro Zeitzone (Polling ruft now_tz/within_market_hours sehr oft auf)
+@lru_cache(maxsize=32)
+def _tz(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
 def now_tz(tz: str) -> dt.datetime:
-    return dt.datetime.now(ZoneInfo(tz))
+    return dt.datetime.now(_tz(tz))
 
 def pct_change(open_price: float, last_price: float) -> float:
     if not open_price:
         return 0.0
     return (last_price - open_price) / open_price * 100.0
 
-def within_market_hours(cfg: Dict[str, Any]) -> bool:
+class _MarketHours(NamedTuple):
+    """Vorgeparste Marktzeiten (einmal pro Config statt pro Aufruf)."""
+    tz: str
+    open_min: int   # Minuten seit Mitternacht
+    close_min: int
+    active_days: frozenset
+    pause: bool
+
+@lru_cache(maxsize=4)
+def _parse_mh(open_str: str, close_str: str, active_days: Tuple[int, ...], tz: str, pause: bool) -> _MarketHours:
+    open_hh, open_mm = map(int, open_str.split(":"))
+    close_hh, close_mm = map(int, close_str.split(":"))
+    return _MarketHours(tz, open_hh * 60 + open_mm, close_hh * 60 + close_mm, frozenset(active_days), pause)
+
+def _parse_market_hours(cfg: Dict[str, Any]) -> _MarketHours:
     # Unterstützt dein Schema {"timezone","open","close","active_days","pause_on_closed"}
-    tz = cfg.get("timezone", "America/New_York")
-    pause = bool(cfg.get("pause_on_closed", True))
-    if not pause:
+    return _parse_mh(
+        str(cfg.get("open", "09:30")),
+        str(cfg.get("close", "16:00")),
+        tuple(int(x) for x in cfg.get("active_days", (1,2,3,4,5))),
+        cfg.get("timezone", "America/New_York"),
+        bool(cfg.get("pause_on_closed", True)),
+    )
+
+def _within_hours(mh: _MarketHours, now: Optional[dt.datetime] = None) -> bool:
+    if not mh.pause:
         return True
-    open_hh, open_mm = map(int, str(cfg.get("open", "09:30")).split(":"))
-    close_hh, close_mm = map(int, str(cfg.get("close", "16:00")).split(":"))
-    active_days = set(int(x) for x in cfg.get("active_days", (1,2,3,4,5)))
-    now = now_tz(tz)
+    now = now or now_tz(mh.tz)
     wk = now.weekday() + 1  # 1..7
-    if active_days and wk not in active_days:
+    if mh.active_days and wk not in mh.active_days:
         return False
-    start = now.replace(hour=open_hh, minute=open_mm, second=0, microsecond=0)
-    end = now.replace(hour=close_hh, minute=close_mm, second=0, microsecond=0)
-    return start <= now <= end
+    nm = now.hour * 60 + now.minute
+    return mh.open_min <= nm <= mh.close_min
+
+def within_market_hours(cfg: Dict[str, Any]) -> bool:
+    return _within_hours(_parse_market_hours(cfg))
+
+@dataclass
+class TickerCtx:
+    """Gesammelte Eingaben eines Tickers für die (Batch-)Entscheidung."""
+    ticker: str
+    open_px: float
+    last_px: float
+    delta_pct: float
+    direction: str   # up/down/none (aktueller Korridor)
+    prev: str        # bisheriger State
+    headlines: List[Dict[str, str]] = field(default_factory=list)
+
+    @property
+    def breakout(self) -> bool:
+        """Neuer Ausbruch aus dem Korridor -> nur dann lohnt News + LLM."""
+        return self.direction != "none" and self.direction != self.prev
+
+@dataclass
+class Decision:
+    """Ergebnis der Agent-Entscheidung für einen Ticker."""
+    send_alert: bool
+    title: str
+    body: str
+    click_url: Optional[str] = None
 
 def format_plain_push(ticker: str, open_px: float, last_px: float, delta_pct: float,
                       headlines: List[Dict[str, str]]) -> Tuple[str, str, Optional[str]]:
@@ -85,24 +159,14 @@ def format_plain_push(ticker: str, open_px: float, last_px: float, delta_pct: fl
         click = headlines[0].get("url") or headlines[0].get("link")
     return title, body, click
 
-def agent_summarize_and_decide(ticker: str, open_px: float, last_px: float, delta_pct: float,
-                               headlines: List[Dict[str, str]], threshold_pct: float) -> Tuple[bool, str, str, Optional[str]]:
-    """
-    Nutzt optional ein LLM, um Wichtigkeit zu bewerten und die Nachricht hübsch zu formatieren.
-    Fällt bei fehlendem LLM automatisiert auf die Plain-Variante zurück.
-    Rückgabe: (send_alert, title, body, click_url)
-    """
-    # 1) harter Gate: ohne LLM nur deterministisch
-    if client is None:
-        title, body, click = format_plain_push(ticker, open_px, last_px, delta_pct, headlines)
-        # deterministische Entscheidung: Δ außerhalb ±threshold -> senden
-        return (abs(delta_pct) >= threshold_pct), title, body, click
-
-    # 2) Mit LLM: Headlines komponieren + Wichtigkeit
-    #    (Wir geben strukturierte JSON-Antwort vor; robust gegen leere News.)
-    sys = (
+@lru_cache(maxsize=8)
+def _build_sys_prompt(threshold_pct: float) -> str:
+    """System-Prompt je Schwelle nur einmal bauen (identischer Prefix -> Prompt-Caching beim Provider)."""
+    return (
         "Du bist ein Stock-Alerts-Agent. Entscheide, ob ein Push geschickt werden soll.\n"
-        "Gib eine JSON-Antwort mit den Feldern: send_alert (bool), title (string, ASCII), "
+        "Du bekommst ein JSON-Array mit Tickern. Gib ein JSON-Objekt "
+        "{\"decisions\": [...]} zurück – eine Entscheidung pro Eintrag, in derselben Reihenfolge, "
+        "jeweils mit den Feldern: ticker (string), send_alert (bool), title (string, ASCII), "
         "body (string, Markdown erlaubt), click_url (string|null).\n"
         "Regeln:\n"
         f"- Schwellwert: {threshold_pct:.3f}% absolut vs. Open.\n"
@@ -110,40 +174,171 @@ def agent_summarize_and_decide(ticker: str, open_px: float, last_px: float, delt
         "- Kürze Headlines prägnant; nutze max. 2–3 relevante. Verwende echte Ziel-Links.\n"
         "- Title muss ASCII bleiben (z. B. 'Stock Alert: TICKER'). Emoji nur im Body.\n"
     )
-    user = {
-        "ticker": ticker,
-        "open": open_px,
-        "last": last_px,
-        "delta_pct": delta_pct,
-        "threshold_pct": threshold_pct,
-        "headlines": headlines[:5],
-    }
+
+def _llm_content(resp: Any) -> str:
+    """Antworttext der ersten Choice ('' bei leerer Antwort statt IndexError)."""
+    choices = getattr(resp, "choices", None) or []
+    return (choices[0].message.content or "") if choices else ""
+
+def _llm_json(content: Optional[str]) -> Dict[str, Any]:
+    """JSON-Objekt aus der LLM-Antwort; gültiges JSON ohne Objekt (Liste, Zahl) -> {}."""
+    data = json_loads(content or "{}")
+    return data if isinstance(data, dict) else {}
+
+def _plain_decision(it: TickerCtx, threshold_pct: float) -> Decision:
+    title, body, click = format_plain_push(it.ticker, it.open_px, it.last_px, it.delta_pct, it.headlines)
+    return Decision(abs(it.delta_pct) >= threshold_pct, title, body, click)
+
+def _batch_messages(items: List[TickerCtx], threshold_pct: float, sys_prompt: str) -> List[Dict[str, str]]:
+    payload = [
+        {
+            "ticker": it.ticker,
+            "open": it.open_px,
+            "last": it.last_px,
+            "delta_pct": it.delta_pct,
+            "threshold_pct": threshold_pct,
+            "headlines": it.headlines[:5],
+        }
+        for it in items
+    ]
+    return [
+        {"role": "system", "content": sys_prompt},
+        {"role": "user", "content": json_dumps(payload).decode("utf-8")},
+    ]
+
+def _parse_batch_decisions(items: List[TickerCtx], content: str, threshold_pct: float) -> List[Decision]:
+    raw = _llm_json(content).get("decisions") or []
+    if not isinstance(raw, list):
+        raw = []
+    # bevorzugt per Ticker zuordnen, sonst per Position
+    by_ticker = {d.get("ticker"): d for d in raw if isinstance(d, dict) and d.get("ticker")}
+    out: List[Decision] = []
+    for i, it in enumerate(items):
+        d = by_ticker.get(it.ticker) or (raw[i] if i < len(raw) and isinstance(raw[i], dict) else None)
+        if not d or not d.get("body"):
+            out.append(_plain_decision(it, threshold_pct))
+            continue
+        out.append(Decision(
+            send_alert=bool(d.get("send_alert", abs(it.delta_pct) >= threshold_pct)),
+            title=str(d.get("title") or f"Stock Alert: {it.ticker}"),
+            body=str(d["body"]),
+            click_url=d.get("click_url") or None,
+        ))
+    return out
+
+async def agent_summarize_and_decide_batch_async(items: List[TickerCtx], threshold_pct: float,
+                                                 sys_prompt: Optional[str] = None) -> List[Decision]:
+    """
+    Nutzt optional ein LLM, um Wichtigkeit zu bewerten und die Nachrichten hübsch zu formatieren –
+    EIN Request für alle Ticker eines Durchlaufs (AsyncOpenAI, blockiert den Event-Loop nicht).
+    Ohne LLM deterministisch: Δ außerhalb ±threshold -> senden (format_plain_push).
+    Rückgabe in derselben Reihenfolge wie items; fehlende/ungültige Einträge -> Plain-Fallback.
+    """
+    if not items:
+        return []
+    if aclient is None:
+        return [_plain_decision(it, threshold_pct) for it in items]
     try:
-        resp = client.chat.completions.create(
+        resp = await aclient.chat.completions.create(
             model=LLM_MODEL,
             temperature=0.2,
-            messages=[
-                {"role": "system", "content": sys},
-                {"role": "user", "content": json.dumps(user, ensure_ascii=False)},
-            ]
+            response_format={"type": "json_object"},
+            messages=_batch_messages(items, threshold_pct, sys_prompt or _build_sys_prompt(threshold_pct)),
         )
-        content = resp.choices[0].message.content or "{}"
-        data = json.loads(content)
-        send_alert = bool(data.get("send_alert", abs(delta_pct) >= threshold_pct))
-        title = str(data.get("title") or f"Stock Alert: {ticker}")
-        body = str(data.get("body") or "")
-        click_url = data.get("click_url") or None
-        if not body:
-            # Fallback, falls LLM keine Body liefert
-            title, body, click_url = format_plain_push(ticker, open_px, last_px, delta_pct, headlines)
-        return send_alert, title, body, click_url
-    except Exception:
-        # robuster Fallback
-        title, body, click = format_plain_push(ticker, open_px, last_px, delta_pct, headlines)
-        return (abs(delta_pct) >= threshold_pct), title, body, click
+        return _parse_batch_decisions(items, _llm_content(resp), threshold_pct)
+    except _LLM_ERRORS:
+        # robuster Fallback (API-/Netzwerkfehler, abgeschnittene Antwort)
+        return [_plain_decision(it, threshold_pct) for it in items]
 
 # ----------------------------- Agent-Workflow -----------------------------
-def run_agent_once(
+def _direction(d_pct: float, threshold_pct: float) -> str:
+    return "up" if d_pct >= threshold_pct else ("down" if d_pct <= -threshold_pct else "none")
+
+
+def _classify(tickers: List[str], prices: Dict[str, Tuple[float, float]],
+              state: Dict[str, str], threshold_pct: float) -> List[TickerCtx]:
+    """
+    Stufe 2: Δ% und Korridor für ALLE Ticker in einem Schritt (NumPy, sonst Python).
+    Semantik wie pct_change/_direction: Open 0 -> Δ 0 %, NaN -> kein Ausbruch.
+    """
+    px = [prices[t] for t in tickers]
+    if np is not None and px:
+        arr = np.asarray(px, dtype=float)
+        o, l = arr[:, 0], arr[:, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            deltas = np.where(o != 0, (l - o) / o * 100.0, 0.0)
+        dirs = np.where(deltas >= threshold_pct, "up", np.where(deltas <= -threshold_pct, "down", "none"))
+        d_list, dir_list = deltas.tolist(), dirs.tolist()
+    else:
+        d_list = [pct_change(o, l) for o, l in px]
+        dir_list = [_direction(d, threshold_pct) for d in d_list]
+    return [
+        TickerCtx(t, o, l, d, direction, state.get(t, "none"))
+        for t, (o, l), d, direction in zip(tickers, px, d_list, dir_list)
+    ]
+
+
+def _news_query(t: str) -> str:
+    name = ""
+    if auto_keywords:
+        try:
+            name, _req = auto_keywords(t)  # nach prefetch_company_meta nur noch In-Memory
+        except YF_ERRORS:
+            name = ""
+    return build_query(name, t)
+
+
+def _fetch_news(items: List[TickerCtx], news_cfg: Dict[str, Any]) -> None:
+    """
+    Stufe 4: Headlines für alle übrigen Ticker als Batch (DE), danach EIN Fallback-Batch
+    (EN/US) nur für die Ticker ohne Treffer. Schreibt it.headlines.
+    """
+    queries = {it.ticker: _news_query(it.ticker) for it in items}
+    common = {
+        "limit": int(news_cfg.get("max_items", 3)),
+        "lookback_hours": int(news_cfg.get("lookback_hours", 12)),
+    }
+    found = fetch_headlines_batch(
+        queries, lang=news_cfg.get("lang", "de"), country=news_cfg.get("country", "DE"), **common
+    )
+    retry = {t: q for t, q in queries.items() if not found.get(t)}
+    if retry:
+        found.update(fetch_headlines_batch(
+            retry,
+            lang=news_cfg.get("fallback_lang", "en"),
+            country=news_cfg.get("fallback_country", "US"),
+            **common,
+        ))
+    for it in items:
+        it.headlines = found.get(it.ticker) or []
+
+
+def _dispatch(it: TickerCtx, dec: Optional[Decision], ctx: Dict[str, Any]) -> Optional[str]:
+    """
+    Korridor anwenden und ggf. pushen (dec=None: Ticker wurde nicht bewertet).
+    Rückgabe: neuer Korridor-State oder None, falls unverändert.
+    """
+    # nur senden, wenn neu aus Korridor ausbricht
+    if dec is not None and it.breakout and dec.send_alert:
+        notify_ntfy(
+            server=ctx["ntfy_server"],
+            topic=ctx["ntfy_topic"],
+            title=dec.title,          # ASCII-Header
+            message=dec.body,         # Markdown/Unicode ok
+            markdown=True,
+            click_url=dec.click_url,
+            dry_run=ctx["dry_run"],
+            session=_SESSION,
+        )
+        return it.direction
+    if it.direction == "none" and it.prev != "none":
+        # Reset: zurück im Korridor
+        return "none"
+    # nichts zu tun
+    return None
+
+
+async def run_agent_once_async(
     *,
     tickers: List[str],
     threshold_pct: float,
@@ -155,93 +350,130 @@ def run_agent_once(
     test_cfg: Dict[str, Any] | None = None,
 ) -> None:
     """
-    Agent-basierter Einzeldurchlauf:
-      - Market hours (optional) beachten
-      - Für jeden Ticker Open/Last, Δ%
-      - Headlines holen
-      - LLM (falls aktiv) entscheidet/komponiert Nachricht
-      - Korridor/State anwenden (up/down/none), dann ntfy
+    Agent-basierter Einzeldurchlauf als Stufen-Pipeline über ALLE Ticker:
+      1) Market hours (optional) beachten, Kurse als Batch (Open/Last)
+      2) Δ% und Korridor vektorisiert
+      3) nur Ticker mit neuem Ausbruch weiter
+      4) Headlines als Batch
+      5) LLM (falls aktiv) entscheidet/komponiert Nachrichten – ein Request für alle Ausbrüche
+      6) Korridor/State anwenden (up/down/none), ntfy-Pushes gleichzeitig
+    Blockierende Tools (yfinance, News, ntfy) laufen per asyncio.to_thread.
+    Der State wird höchstens einmal gespeichert.
     """
     test_cfg = test_cfg or {}
-    if market_hours_cfg.get("pause_on_closed", True) and not test_cfg.get("bypass_market_hours", False):
-        if not within_market_hours(market_hours_cfg):
+    mh = _parse_market_hours(market_hours_cfg)
+    if mh.pause and not test_cfg.get("bypass_market_hours", False):
+        if not _within_hours(mh):
             print("Außerhalb der Handelszeiten – Agent-Durchlauf übersprungen.")
             return
 
     st = load_state(state_file)  # speichert pro Ticker Richtung: up/down/none
-    tz = market_hours_cfg.get("timezone", "America/New_York")
-    print(f"Agent run @ {now_tz(tz):%Y-%m-%d %H:%M:%S} | tickers={','.join(tickers)}")
+    print(f"Agent run @ {now_tz(mh.tz):%Y-%m-%d %H:%M:%S} | tickers={','.join(tickers)}")
+    if not tickers:
+        return
 
-    for t in tickers:
-        try:
-            open_px, last_px = get_open_and_last(t)
-            d_pct = pct_change(open_px, last_px)
-
-            # Richtung für Korridor
-            direction = "up" if d_pct >= threshold_pct else ("down" if d_pct <= -threshold_pct else "none")
-            prev = st.get(t, "none")
-
-            # Headlines (optional)
-            headlines: List[Dict[str, str]] = []
-            if news_cfg and news_cfg.get("enabled", True):
-                # Query bauen
-                name = ""
-                if auto_keywords:
-                    try:
-                        name, _req = auto_keywords(t)
-                    except Exception:
-                        name = ""
-                q = build_query(name, t)
-                headlines = fetch_headlines(
-                    q,
-                    limit=int(news_cfg.get("max_items", 3)),
-                    lookback_hours=int(news_cfg.get("lookback_hours", 12)),
-                    lang=news_cfg.get("lang", "de"),
-                    country=news_cfg.get("country", "DE"),
-                )
-                if not headlines:
-                    # Fallback EN/US
-                    headlines = fetch_headlines(
-                        q,
-                        limit=int(news_cfg.get("max_items", 3)),
-                        lookback_hours=int(news_cfg.get("lookback_hours", 12)),
-                        lang=news_cfg.get("fallback_lang", "en"),
-                        country=news_cfg.get("fallback_country", "US"),
-                    )
-
-            # Agent-Entscheidung (oder Fallback)
-            send, title, body, click = agent_summarize_and_decide(
-                ticker=t,
-                open_px=open_px,
-                last_px=last_px,
-                delta_pct=d_pct,
-                headlines=headlines,
-                threshold_pct=float(threshold_pct),
-            )
-
-            # Korridor anwenden: nur senden, wenn neu aus Korridor ausbricht
-            if direction != "none" and direction != prev and send:
-                notify_ntfy(
-                    server=ntfy_server,
-                    topic=ntfy_topic,
-                    title=title,          # ASCII-Header
-                    message=body,         # Markdown/Unicode ok
-                    markdown=True,
-                    click_url=click,
-                    dry_run=bool(test_cfg.get("dry_run", False)),
-                )
-                st[t] = direction
-                save_state(state_file, st)
-            elif direction == "none" and prev != "none":
-                # Reset: zurück im Korridor
-                st[t] = "none"
-                save_state(state_file, st)
-            else:
-                # nichts zu tun
-                pass
+    # Firmen-Metadaten (für News-Keywords) vorwärmen, parallel zum Kurs-Batch;
+    # danach trifft auto_keywords() in der Ticker-Stufe nur noch den In-Memory-Cache
+    warm = None
+    if news_cfg and news_cfg.get("enabled", True) and prefetch_company_meta:
+        warm = asyncio.create_task(asyncio.to_thread(prefetch_company_meta, tickers))
+
+    unexpected: Optional[BaseException] = None
 
+    # 1) Kurse aller Ticker in einem Request; fehlende Ticker einzeln (gleichzeitig) nachladen
+    prices = await asyncio.to_thread(get_open_and_last_batch, tickers)
+    missing = [t for t in tickers if t not in prices]
+    if missing:
+        results = await asyncio.gather(
+            *(asyncio.to_thread(get_open_and_last, t) for t in missing), return_exceptions=True
+        )
+        for t, res in zip(missing, results):
+            if isinstance(res, BaseException):
+                print(f"Fehler bei {t}: {res}")
+                if not isinstance(res, _TICKER_ERRORS):
+                    unexpected = unexpected or res
+            else:
+                prices[t] = res
+    if warm is not None:
+        try:
+            await warm
         except Exception as e:
-            print(f"Fehler bei {t}: {e}")
+            # nur ein Vorwärmen: auto_keywords lädt bzw. fällt pro Ticker selbst zurück
+            print(f"Company-Prefetch fehlgeschlagen: {e}")
+    if unexpected:
+        raise unexpected  # noch nichts versendet -> kein State zu retten
+
+    ctx: Dict[str, Any] = {
+        "threshold_pct": float(threshold_pct),
+        "sys_prompt": _build_sys_prompt(float(threshold_pct)) if aclient is not None else None,
+        "ntfy_server": ntfy_server,
+        "ntfy_topic": ntfy_topic,
+        "dry_run": bool(test_cfg.get("dry_run", False)),
+        "force_all": bool(test_cfg.get("force_all", False)),  # Debug: News/LLM für alle Ticker
+    }
+
+    # 2) Δ%/Korridor für alle Ticker auf einmal, 3) nur neue Ausbrüche weiterreichen
+    items = _classify([t for t in tickers if t in prices], prices, st, ctx["threshold_pct"])
+    todo = [it for it in items if it.breakout or ctx["force_all"]]
+
+    # 4) Headlines für die Ausbrüche als Batch
+    if todo and news_cfg and news_cfg.get("enabled", True):
+        await asyncio.to_thread(_fetch_news, todo, news_cfg)
+
+    # 5) eine (LLM-)Entscheidung für alle Ticker mit neuem Ausbruch
+    decided = await agent_summarize_and_decide_batch_async(todo, ctx["threshold_pct"], sys_prompt=ctx["sys_prompt"])
+    decisions: Dict[str, Decision] = {it.ticker: dec for it, dec in zip(todo, decided)}
+
+    # 6) Korridor anwenden + alle Pushes gleichzeitig, State höchstens einmal speichern
+    changed: set[str] = set()
+    try:
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(_dispatch, it, decisions.get(it.ticker), ctx) for it in items),
+            return_exceptions=True,
+        )
+        for it, new_state in zip(items, outcomes):
+            if isinstance(new_state, BaseException):
+                print(f"Fehler bei {it.ticker}: {new_state}")
+                if not isinstance(new_state, _TICKER_ERRORS):
+                    unexpected = unexpected or new_state
+                continue
+            if new_state is not None and new_state != st.get(it.ticker, "none"):
+                st[it.ticker] = new_state
+                changed.add(it.ticker)
+        if unexpected:
+            raise unexpected  # finally speichert vorher die erfolgreichen Alerts
+    finally:
+        # auch bei Abbruch: bereits verschickte Alerts nicht vergessen
+        if changed:
+            save_state(state_file, st)
+
+    # Company-Cache einmal pro Durchlauf schreiben statt pro Ticker
+    if flush_cache:
+        flush_cache()
+
+
+def run_agent_once(
+    *,
+    tickers: List[str],
+    threshold_pct: float,
+    ntfy_server: str,
+    ntfy_topic: str,
+    state_file: Path,
+    market_hours_cfg: Dict[str, Any],
+    news_cfg: Dict[str, Any] | None = None,
+    test_cfg: Dict[str, Any] | None = None,
+) -> None:
+    """Synchroner Einstieg (CLI/Cron): führt run_agent_once_async in einem eigenen Event-Loop aus."""
+    asyncio.run(run_agent_once_async(
+        tickers=tickers,
+        threshold_pct=threshold_pct,
+        ntfy_server=ntfy_server,
+        ntfy_topic=ntfy_topic,
+        state_file=state_file,
+        market_hours_cfg=market_hours_cfg,
+        news_cfg=news_cfg,
+        test_cfg=test_cfg,
+    ))
 
 # ----------------------------- CLI-Einstieg -----------------------------
 if __name__ == "__main__":
@@ -0,0 +1,108 @@
+"""
+Numerische Kernel für run_once.
+Mit numba werden sie per @njit kompiliert, sonst laufen sie als NumPy/reines Python.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op-Ersatz: erlaubt sowohl @njit als auch @njit(cache=True)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def pct_change_arr(open_arr, last_arr, out):
+    """Δ% vs. Open für alle Ticker; Open 0 -> 0.0 (wie _pct_change)."""
+    for i in range(open_arr.size):
+        o = open_arr[i]
+        out[i] = 0.0 if o == 0.0 else (last_arr[i] - o) / o * 100.0
+    return out
+
+
+def pct_change_batch(opens: Sequence[float], lasts: Sequence[float]) -> List[float]:
+    """
+    Δ% für parallele Open-/Last-Listen in einem Aufruf.
+    numba -> JIT-Kernel, nur NumPy -> vektorisiert, sonst Python-Schleife.
+    """
+    if np is None:
+        return [0.0 if not o else (l - o) / o * 100.0 for o, l in zip(opens, lasts)]
+    o = np.asarray(opens, dtype=np.float64)
+    l = np.asarray(lasts, dtype=np.float64)
+    if HAVE_NUMBA:
+        return pct_change_arr(o, l, np.empty_like(o)).tolist()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(o != 0.0, (l - o) / o * 100.0, 0.0).tolist()
+
+
+_LABELS = ("down", "none", "up")
+_LABELS_ARR = np.array(_LABELS) if np is not None else None
+DIR_CODES = {"down": -1, "none": 0, "up": 1}
+_UNKNOWN = 2  # unbekannter State-Wert: ungleich jeder Richtung -> wird wie bisher zurückgesetzt
+
+# Aktion je Ticker (Ergebnis von corridor_actions)
+QUIET, BREAKOUT, RESET, HELD = 0, 1, 2, 3
+
+
+def classify_codes(pcts: Sequence[float], threshold_pct: float):
+    """Korridor-Code je Δ%: -1 (down), 0 (none), 1 (up); NumPy -> int8-Array, sonst Liste."""
+    thr = float(threshold_pct)
+    if np is None:
+        return [(p >= thr) - (p <= -thr) for p in pcts]
+    arr = np.asarray(pcts, dtype=np.float64)
+    return np.where(arr >= thr, 1, np.where(arr <= -thr, -1, 0)).astype(np.int8)
+
+
+def decode_codes(codes) -> List[str]:
+    if np is None:
+        return [_LABELS[c + 1] for c in codes]
+    return _LABELS_ARR[np.asarray(codes) + 1].tolist()
+
+
+def encode_states(state: Dict[str, str], tickers: Sequence[str]):
+    """Gespeicherte Richtungen positionsgleich zu `tickers` als int8-Codes (SoA statt Dict-Lookups)."""
+    codes = [DIR_CODES.get(state.get(tk, "none"), _UNKNOWN) for tk in tickers]
+    return np.asarray(codes, dtype=np.int8) if np is not None else codes
+
+
+def corridor_actions(codes, prev_codes) -> List[int]:
+    """
+    Korridor-Übergang je Ticker in einem Durchlauf:
+    BREAKOUT (neuer Ausbruch), RESET (zurück im Korridor), HELD (schon gemeldet), QUIET.
+    """
+    if np is None:
+        return [
+            (BREAKOUT if c != p else HELD) if c else (RESET if p else QUIET)
+            for c, p in zip(codes, prev_codes)
+        ]
+    c = np.asarray(codes, dtype=np.int8)
+    p = np.asarray(prev_codes, dtype=np.int8)
+    return np.where(c != 0, np.where(c != p, BREAKOUT, HELD), np.where(p != 0, RESET, QUIET)).tolist()
+
+
+@njit(cache=True)
+def mh_check(ts_epoch, open_min, close_min, days_mask, tz_offset_s):
+    """
+    Marktzeiten-Prädikat nur mit Integer-Arithmetik (Backtests rufen es sehr oft auf).
+    days_mask: Bit 0 = Montag … Bit 6 = Sonntag; Fenster inkl. Schlussminute, sekundengenau.
+    """
+    local = ts_epoch + tz_offset_s
+    days = local // 86400
+    weekday = (days + 3) % 7  # 1970-01-01 war ein Donnerstag -> Montag = 0
+    if not (days_mask >> weekday) & 1:
+        return False
+    sod = local - days * 86400
+    return open_min * 60 <= sod <= close_min * 60
@@ -1,20 +1,30 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple, List
+import atexit
+import hashlib
 import json
+import os
+import re
+import threading
 import time
 import logging
 import yfinance as yf
 
+from src.app.market import YF_ERRORS
+from src.app.utils import json_dumps, json_loads
+
 logger = logging.getLogger("stock-alerts")
 
 # Cache-Datei im selben Ordner wie diese Datei
 CACHE_FILE: Path = Path(__file__).resolve().parent / "company_cache.json"
 
 # Häufige Rechtsformen/Suffixe (dürfen gern noch erweitert werden)
-LEGAL_SUFFIXES = {
+LEGAL_SUFFIXES = frozenset({
     # EN
     "inc", "inc.", "corp", "corp.", "corporation", "co", "co.", "company",
     "ltd", "ltd.", "limited", "llc", "lp", "plc",
@@ -25,12 +35,22 @@ LEGAL_SUFFIXES = {
     "spa", "s.p.a.", "sarl", "sas",
     # Häufiges Nachwort
     "holding", "holdings",
-}
-
-@dataclass
+})
+
+# Eine verankerte Regex für die ganze Suffix-Kette am Namensende ("Foo Holdings, Ltd.").
+# Nur Einträge ohne Punkt: bisher wurde jedes Token vor dem Vergleich an ",. " beschnitten
+# ("S.A." -> "s.a"), Formen wie "s.a." griffen also nie – "Nestle S.A." bleibt wie gehabt stehen.
+_SUFFIX_RE = re.compile(
+    r"(?:[,\s]+(?:"
+    + "|".join(re.escape(s) for s in sorted((x for x in LEGAL_SUFFIXES if "." not in x), key=len, reverse=True))
+    + r")\.?)+[,.\s]*$",
+    re.IGNORECASE,
+)
+
+@dataclass(frozen=True)
 class CompanyMeta:
     """
-    Metadaten zu einer Firma/einem Ticker.
+    Metadaten zu einer Firma/einem Ticker (unveränderlich, da per lru_cache geteilt).
     """
     ticker: str
     name: Optional[str]      # gesäuberter Name (ohne Rechtsform)
@@ -39,22 +59,77 @@ class CompanyMeta:
     base_ticker: str         # Ticker ohne Suffixe (z. B. "SAP" aus "SAP.DE")
 
 
+# In-Memory-Abbild von CACHE_FILE: einmal laden, im Speicher ändern, gesammelt schreiben
+_CACHE: Optional[Dict[str, Any]] = None
+_CACHE_MTIME: float = 0.0
+_DIRTY: bool = False
+_last_written_hash: Optional[str] = None  # Hash des zuletzt geschriebenen Inhalts
+_CACHE_LOCK = threading.RLock()  # Agent löst Ticker parallel auf
+
+
+def _cache_mtime() -> float:
+    try:
+        return CACHE_FILE.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
 def _load_cache() -> Dict[str, Any]:
-    """Cache aus JSON laden."""
+    """Cache aus JSON laden (liest immer von der Platte – intern nur über _cache())."""
     if CACHE_FILE.exists():
         try:
-            return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
-        except Exception as e:
+            return json_loads(CACHE_FILE.read_bytes())
+        except (json.JSONDecodeError, OSError) as e:
             logger.debug("company cache defekt (%s) -> neu anlegen", e)
             return {}
     return {}
 
 
-def _save_cache(cache: Dict[str, Any]) -> None:
-    """Cache speichern."""
-    CACHE_FILE.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
+def _cache() -> Dict[str, Any]:
+    """
+    Prozessweites Cache-Dict (Singleton). Die Datei wird nur beim ersten Zugriff
+    gelesen – und erneut nur, wenn ein anderer Prozess sie geändert hat (mtime);
+    eigene, noch ungespeicherte Änderungen haben Vorrang.
+    """
+    global _CACHE, _CACHE_MTIME
+    with _CACHE_LOCK:
+        if _CACHE is not None and (_DIRTY or _cache_mtime() == _CACHE_MTIME):
+            return _CACHE
+        _CACHE_MTIME = _cache_mtime()
+        _CACHE = _load_cache()
+        return _CACHE
 
 
+def _save_cache(cache: Dict[str, Any]) -> None:
+    """Singleton als geändert markieren; geschrieben wird gesammelt in flush_cache()."""
+    global _CACHE, _DIRTY
+    with _CACHE_LOCK:
+        _CACHE = cache
+        _DIRTY = True
+
+
+def flush_cache() -> None:
+    """Geänderten Cache einmalig auf die Platte schreiben (z. B. nach einem Batch)."""
+    global _CACHE_MTIME, _DIRTY, _last_written_hash
+    with _CACHE_LOCK:
+        if not _DIRTY or _CACHE is None:
+            return
+        payload = json_dumps(_CACHE, indent=True)
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        if digest != _last_written_hash:
+            # atomar: erst Temp-Datei, dann umbenennen -> nie halb geschriebener Cache
+            tmp = CACHE_FILE.with_suffix(".json.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, CACHE_FILE)
+            _last_written_hash = digest
+        _CACHE_MTIME = _cache_mtime()
+        _DIRTY = False
+
+
+atexit.register(flush_cache)
+
+
+@lru_cache(maxsize=1024)
 def _strip_legal_suffixes(name: str) -> str:
     """
     Entfernt gängige Rechtsform-Zusätze am Ende des Namens.
@@ -62,12 +137,15 @@ def _strip_legal_suffixes(name: str) -> str:
     """
     if not name:
         return ""
-    parts: List[str] = [p.strip(",. ") for p in name.split()]
-    while parts and parts[-1].lower().strip(",. ") in LEGAL_SUFFIXES:
-        parts.pop()
-    return " ".join(parts).strip() if parts else name.strip()
+    stripped = _SUFFIX_RE.sub("", name).strip(" ,")
+    # Nur noch ein Suffix-Wort übrig ("Holdings Inc" -> "Holdings")? Dann wie bisher den
+    # vollen Namen behalten – sonst ändern sich die News-Keywords
+    if not stripped or stripped.lower().strip(",. ") in LEGAL_SUFFIXES:
+        return name.strip()
+    return stripped
 
 
+@lru_cache(maxsize=1024)
 def _base_ticker(symbol: str) -> str:
     """
     Basis-Ticker extrahieren.
@@ -93,11 +171,11 @@ def _fetch_yf_info(symbol: str, retries: int = 2, delay: float = 0.4) -> Dict[st
             # yfinance>=0.2: get_info() bevorzugen; fallback auf .info
             try:
                 info = t.get_info()
-            except Exception:
+            except YF_ERRORS:
                 info = getattr(t, "info", {}) or {}
             if isinstance(info, dict) and info:
                 return info
-        except Exception as e:
+        except YF_ERRORS as e:
             last_exc = e
             time.sleep(delay)
     if last_exc:
@@ -105,21 +183,10 @@ def _fetch_yf_info(symbol: str, retries: int = 2, delay: float = 0.4) -> Dict[st
     return {}
 
 
-def get_company_meta(symbol: str) -> CompanyMeta:
+def _meta_from_info(symbol: str, info: Dict[str, Any]) -> CompanyMeta:
     """
-    Ermittelt Metadaten (Name, Base-Ticker, Quelle) mit Cache und Fallbacks.
+    Baut CompanyMeta aus einem Yahoo-Info-Dict (Name säubern, Fallback auf Base-Ticker).
     """
-    cache = _load_cache()
-    if symbol in cache:
-        try:
-            data = cache[symbol]
-            return CompanyMeta(**data)
-        except Exception:
-            # Falls Cache-Eintrag alt/inkompatibel ist -> neu aufbauen
-            pass
-
-    info = _fetch_yf_info(symbol)
-
     raw_name: Optional[str] = None
     source = "fallback"
 
@@ -137,7 +204,7 @@ def get_company_meta(symbol: str) -> CompanyMeta:
         clean = base
         source = "fallback"
 
-    meta = CompanyMeta(
+    return CompanyMeta(
         ticker=symbol,
         name=clean,
         raw_name=raw_name,
@@ -145,16 +212,82 @@ def get_company_meta(symbol: str) -> CompanyMeta:
         base_ticker=base,
     )
 
-    cache[symbol] = asdict(meta)
-    _save_cache(cache)
+
+@lru_cache(maxsize=1024)
+def get_company_meta(symbol: str) -> CompanyMeta:
+    """
+    Ermittelt Metadaten (Name, Base-Ticker, Quelle) mit Cache und Fallbacks.
+    """
+    cache = _cache()
+    if symbol in cache:
+        try:
+            data = cache[symbol]
+            return CompanyMeta(**data)
+        except TypeError:
+            # Falls Cache-Eintrag alt/inkompatibel ist -> neu aufbauen
+            pass
+
+    meta = _meta_from_info(symbol, _fetch_yf_info(symbol))
+
+    with _CACHE_LOCK:
+        cache[symbol] = asdict(meta)
+        _save_cache(cache)
     return meta
 
 
+PREFETCH_WORKERS = 8
+
+
+def prefetch_company_meta(symbols: List[str], max_workers: int = PREFETCH_WORKERS) -> None:
+    """
+    Wärmt den Cache für alle fehlenden Symbole über EIN yf.Tickers-Objekt vor
+    (gemeinsame Session statt eines neuen Ticker-Objekts pro Symbol).
+    Die info-Requests laufen parallel im Thread-Pool -> Kaltstart ≈ max statt Summe der Latenzen.
+    Reine Optimierung: Fehler werden nur geloggt, get_company_meta lädt später pro Symbol nach.
+    """
+    cache = _cache()
+    missing = [s for s in dict.fromkeys(symbols) if s and s not in cache]
+    if not missing:
+        return
+    try:
+        batch = yf.Tickers(" ".join(missing))
+    except Exception as e:
+        logger.debug("yf.Tickers fehlgeschlagen (%s): %s", ",".join(missing), e)
+        return
+
+    def _one(sym: str) -> None:
+        t = batch.tickers.get(sym) or batch.tickers.get(sym.upper())
+        if t is None:
+            return
+        try:
+            info = t.get_info()
+            if not isinstance(info, dict) or not info:
+                return
+            meta = asdict(_meta_from_info(sym, info))
+        except Exception as e:
+            # auch Exoten (KeyError/TypeError aus ungewöhnlichen info-Payloads, curl-Fehler)
+            logger.debug("Yahoo-Prefetch fehlgeschlagen für %s: %s", sym, e)
+            return
+        with _CACHE_LOCK:
+            cache[sym] = meta
+
+    workers = max(1, min(max_workers, len(missing)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(_one, missing))
+    _save_cache(cache)
+
+
 def auto_keywords(symbol: str) -> Tuple[str, list[str]]:
     """
     Liefert (Anzeige-Name, Pflicht-Keywords) für News-Filter.
     Keywords z. B.: [Name, Base, Symbol] – du kannst hier später verfeinern.
     """
+    name, kws = _auto_keywords_cached(symbol)
+    return name, list(kws)  # Kopie, damit Aufrufer den Cache nicht verändern
+
+
+@lru_cache(maxsize=1024)
+def _auto_keywords_cached(symbol: str) -> Tuple[str, Tuple[str, ...]]:
     meta = get_company_meta(symbol)
     name = (meta.name or meta.raw_name or meta.base_ticker or symbol).strip()
     base = meta.base_ticker or symbol
@@ -170,7 +303,7 @@ def auto_keywords(symbol: str) -> Tuple[str, list[str]]:
             seen.add(kk.lower())
             cleaned.append(kk)
 
-    return name, cleaned
+    return name, tuple(cleaned)
 
 
 # Optional: Query-Helfer für News (falls in core genutzt)
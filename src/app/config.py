@@ -15,7 +15,8 @@ DEFAULTS: Dict[str, Any] = {
     },
     "ntfy": {
         "server": "https://ntfy.sh",   # Default ntfy server
-        "topic": "CHANGE-ME"           # Must be set in config.json or .env
+        "topic": "CHANGE-ME",          # Must be set in config.json or .env
+        "batch_alerts": False          # One combined push per run instead of one per ticker
     },
     "tickers": ["AAPL"],               # Default ticker(s) to monitor
     "threshold_pct": 3.0,              # Default % threshold for alerts
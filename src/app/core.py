@@ -2,11 +2,23 @@ from __future__ import annotations
 
 import datetime as dt
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 from zoneinfo import ZoneInfo
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.app._kernels import (
+    BREAKOUT, QUIET, RESET,
+    classify_codes, corridor_actions, decode_codes, encode_states, mh_check, pct_change_batch,
+)
 from src.app.market import get_open_and_last
 from src.app.ntfy import notify_ntfy
 from src.app.state import load_state, save_state
@@ -19,8 +31,23 @@ except Exception:  # pragma: no cover
     auto_keywords = None
     news_query_for_ticker = None
 
+try:
+    from src.app.news import _extract_original_url
+except Exception:  # pragma: no cover
+    _extract_original_url = None
+
 logger = logging.getLogger("stock-alerts")
 
+# Eine HTTP-Session für alles aus run_once (News, Redirect-Auflösung, ntfy):
+# keep-alive + Connection-Pool statt TCP/TLS-Handshake pro Request
+_HTTP = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.2))
+_HTTP.mount("https://", _adapter)
+_HTTP.mount("http://", _adapter)
+_HTTP.headers.update({
+    "User-Agent": "Mozilla/5.0 (compatible; stock-alerts/1.0)",
+    "Accept-Encoding": "gzip",
+})
 
 # ----------------------------- kleine Helfer -----------------------------
 def _pct_change(open_price: float, last_price: float) -> float:
@@ -34,22 +61,31 @@ def _format_title(ticker: str) -> str:
     return f"Stock Alert: {ticker}"
 
 
+_ARROWS = ("📉", "📈")  # Index: pct >= 0
+
+
 def _format_body(ticker: str, open_price: float, last_price: float, pct: float) -> str:
-    up = pct >= 0
-    arrow = "📈" if up else "📉"
-    dirsym = "↑" if up else "↓"
-    return (
-        f"{arrow} {ticker}: {pct:+.2f}% vs. Open\n"
-        f"Aktuell: {last_price:.2f} | Open: {open_price:.2f}"
-    )
+    return "".join((
+        _ARROWS[pct >= 0], " ", ticker, ": ", format(pct, "+.2f"), "% vs. Open\n",
+        "Aktuell: ", format(last_price, ".2f"), " | Open: ", format(open_price, ".2f"),
+    ))
+
+
+_SCHEMES = ("http://", "https://")
+
+
+@lru_cache(maxsize=4096)
+def _ensure_https_cached(u: str) -> str:
+    # dieselben Feed-URLs kommen über viele Ticks wieder -> nach dem ersten Mal ein Dict-Hit
+    if u.startswith(_SCHEMES):
+        return u
+    return "https://" + u.lstrip("/")
 
 
 def _ensure_https(u: str) -> str:
     if not u:
         return ""
-    if u.startswith(("http://", "https://")):
-        return u
-    return "https://" + u.lstrip("/")
+    return _ensure_https_cached(u)
 
 
 def _item_url(it: Dict[str, Any]) -> str:
@@ -57,6 +93,48 @@ def _item_url(it: Dict[str, Any]) -> str:
     return _ensure_https((it.get("url") or it.get("link") or "").strip())
 
 
+def _resolve_url(url: str) -> str:
+    """
+    Robuste Original-URL über news._extract_original_url, sonst die Eingabe.
+    Das Caching (nur erfolgreiche Auflösungen) übernimmt news.py.
+    """
+    if _extract_original_url is None:
+        return url
+    try:
+        return _extract_original_url(url, session=_HTTP)
+    except Exception:
+        return url
+
+
+def _resolve_urls(urls: List[str]) -> List[str]:
+    # jede Auflösung kann HTTP kosten -> parallel statt N sequenzieller Round-Trips
+    if len(urls) <= 1:
+        return [_resolve_url(u) for u in urls]
+    with ThreadPoolExecutor(max_workers=min(8, len(urls))) as ex:
+        return list(ex.map(_resolve_url, urls))
+
+
+_TRACKING_PARAMS = frozenset({"gclid", "fbclid"})
+
+
+@lru_cache(maxsize=2048)
+def _canonical(url: str) -> str:
+    """
+    Vergleichsschlüssel für Duplikate: ohne Fragment/Tracking-Parameter,
+    Host klein, ohne abschließenden Slash (die angezeigte URL bleibt unverändert).
+    """
+    try:
+        p = urlparse(url)
+    except ValueError:
+        return url
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(p.query, keep_blank_values=True)
+        if not k.startswith("utm_") and k not in _TRACKING_PARAMS
+    ])
+    path = p.path.rstrip("/") if p.path != "/" else ""
+    return urlunparse((p.scheme, p.netloc.lower(), path, p.params, query, ""))
+
+
 def _format_headlines(items: List[Dict[str, Any]]) -> str:
     """
     Kompakter Markdown-Block ohne Überschrift (die setzt run_once).
@@ -64,34 +142,22 @@ def _format_headlines(items: List[Dict[str, Any]]) -> str:
     """
     if not items:
         return ""
-    lines: List[str] = []
-    seen = set()
+    rows = []
     for it in items:
         title = (it.get("title") or "").strip()
         src = (it.get("source") or "").strip()
         url = _item_url(it)
-        if not title or not url:
-            continue
-
-        # robuste Original-URL über news._extract_original_url
-        try:
-            from src.app.news import _extract_original_url as _news_extract
-            orig = _news_extract(url, resolve_redirects=True)
-        except Exception:
-            orig = url
+        if title and url:
+            rows.append((title, src, url))
 
-        # Duplikate vermeiden
-        if orig in seen:
+    lines: List[str] = []
+    seen = set()
+    for (title, src, _url), orig in zip(rows, _resolve_urls([r[2] for r in rows])):
+        # Duplikate vermeiden (auch bei /, #frag oder utm_* als einzigem Unterschied)
+        key = _canonical(orig)
+        if key in seen:
             continue
-        seen.add(orig)
-
-        # Domain (kurz) für die zweite Zeile
-        try:
-            from urllib.parse import urlparse
-            dom = urlparse(orig).netloc
-            dom = dom[4:] if dom.startswith("www.") else dom
-        except Exception:
-            dom = "link"
+        seen.add(key)
 
         src_part = f" — {src}" if src else ""
         lines.append(f"• [{title}]({orig}){src_part}")
@@ -101,8 +167,42 @@ def _format_headlines(items: List[Dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=32)
+def _zi(tz: str) -> ZoneInfo:
+    # ZoneInfo einmal pro Zeitzone bauen (now_tz läuft mehrfach pro run_once)
+    return ZoneInfo(tz)
+
+
+@lru_cache(maxsize=32)
+def _parse_hhmm(s: str) -> Tuple[int, int]:
+    """'09:30' -> (9, 30); nur auf dem Miss-Pfad von _mh_derive, Config-Werte sind praktisch konstant."""
+    hh, sep, mm = s.partition(":")
+    if not sep:
+        raise ValueError(f"Ungültige Uhrzeit (HH:MM erwartet): {s!r}")
+    return int(hh), int(mm)
+
+
+@lru_cache(maxsize=8)
+def _mh_derive(open_s: str, close_s: str, active_days: tuple, pause: bool) -> Tuple[int, int, int, bool]:
+    """
+    Abgeleitete Marktzeiten für Schema A, einmal pro Config statt pro Tick:
+    (Open/Close in Minuten seit Mitternacht, aktive Tage 1..7 als 7-Bit-Maske, pause_on_closed).
+    """
+    open_hh, open_mm = _parse_hhmm(open_s)
+    close_hh, close_mm = _parse_hhmm(close_s)
+    days = {int(x) for x in active_days}
+    mask = 0x7F if not days else sum(1 << (d - 1) for d in days if 1 <= d <= 7)  # leer = alle Tage
+    return open_hh * 60 + open_mm, close_hh * 60 + close_mm, mask, pause
+
+
+@lru_cache(maxsize=64)
+def _tz_offset_s(tz: str, bucket: int) -> int:
+    """UTC-Offset der Zone (Sekunden) für ein 15-Minuten-Fenster; DST-Wechsel liegen auf Viertelstunden."""
+    return int(dt.datetime.fromtimestamp(bucket * 900, _zi(tz)).utcoffset().total_seconds())
+
+
 def now_tz(tz: str) -> dt.datetime:
-    return dt.datetime.now(ZoneInfo(tz))
+    return dt.datetime.now(_zi(tz))
 
 
 def is_market_hours(cfg_mh: dict) -> bool:
@@ -113,20 +213,18 @@ def is_market_hours(cfg_mh: dict) -> bool:
     """
     # Schema A (deine ursprüngliche Struktur)
     if {"timezone", "open", "close"}.issubset(cfg_mh.keys()):
-        tz = cfg_mh.get("timezone", "America/New_York")
-        open_hh, open_mm = map(int, str(cfg_mh.get("open", "09:30")).split(":"))
-        close_hh, close_mm = map(int, str(cfg_mh.get("close", "16:00")).split(":"))
-        active_days = set(int(x) for x in cfg_mh.get("active_days", (1, 2, 3, 4, 5)))
-        pause = bool(cfg_mh.get("pause_on_closed", True))
+        open_min, close_min, days_mask, pause = _mh_derive(
+            str(cfg_mh.get("open", "09:30")),
+            str(cfg_mh.get("close", "16:00")),
+            tuple(cfg_mh.get("active_days", (1, 2, 3, 4, 5))),
+            bool(cfg_mh.get("pause_on_closed", True)),
+        )
         if not pause:
             return True
-        n = now_tz(tz)
-        wk = n.weekday() + 1  # 1..7
-        if active_days and wk not in active_days:
-            return False
-        start = n.replace(hour=open_hh, minute=open_mm, second=0, microsecond=0)
-        end = n.replace(hour=close_hh, minute=close_mm, second=0, microsecond=0)
-        return start <= n <= end
+        # Integer-Kernel (numba, falls vorhanden) statt datetime-Arithmetik pro Aufruf
+        ts = int(time.time())
+        offset = _tz_offset_s(cfg_mh.get("timezone", "America/New_York"), ts // 900)
+        return bool(mh_check(ts, open_min, close_min, days_mask, offset))
 
     # Schema B (Dozentenversion) :contentReference[oaicite:4]{index=4}
     if not cfg_mh.get("enabled", True):
@@ -138,6 +236,131 @@ def is_market_hours(cfg_mh: dict) -> bool:
 
 
 # ------------------------------- Orchestrierung -------------------------------
+def _news_block(tk: str, news_cfg: dict) -> Tuple[str, str | None]:
+    """
+    Headlines für einen Ausbruch (DE -> Fallback EN).
+    Rückgabe: (Markdown-Block inkl. Überschrift oder "", Click-URL oder None).
+    """
+    click_url = None
+
+    # Query bauen (Name + Ticker), Keywords für Filter
+    if news_query_for_ticker:
+        q = news_query_for_ticker(tk)  # nutzt CompanyMeta intern (dort gecacht)
+        # Keywords
+        try:
+            name, req_kw = auto_keywords(tk) if auto_keywords else ("", [])
+        except Exception:
+            req_kw = []
+    else:
+        # Build-Query direkt aus news-Modul
+        try:
+            name, req_kw = auto_keywords(tk) if auto_keywords else ("", [])
+            q = news.build_query(name, tk)
+        except Exception:
+            q = news.build_query("", tk)
+            req_kw = []
+
+    limit = int(news_cfg.get("max_items", news_cfg.get("limit", 3)))
+    fallback_kw = dict(
+        query=q,
+        limit=limit,
+        lookback_hours=max(12, int(news_cfg.get("lookback_hours", 12))),
+        lang=news_cfg.get("fallback_lang", "en"),
+        country=news_cfg.get("fallback_country", "US"),
+        session=_HTTP,
+    )
+    # Optional (news.parallel_fallback, Standard aus): EN/US schon parallel zu DE anfragen
+    # (max statt Summe der Latenzen). Kostet bei jedem Ausbruch einen zweiten Feed-Abruf
+    # samt URL-Auflösung, auch wenn DE reicht -> nur bei häufig leeren DE-Ergebnissen sinnvoll
+    fallback = None
+    if news_cfg.get("parallel_fallback", False):
+        ex = ThreadPoolExecutor(max_workers=1)
+        fallback = ex.submit(news.fetch_headlines, **fallback_kw)
+        ex.shutdown(wait=False)  # nicht auf EN warten, falls DE reicht
+
+    # DE zuerst …
+    items = news.fetch_headlines(
+        query=q,
+        limit=limit,
+        lookback_hours=int(news_cfg.get("lookback_hours", 12)),
+        lang=news_cfg.get("lang", "de"),
+        country=news_cfg.get("country", "DE"),
+        session=_HTTP,
+    )
+    if req_kw:
+        items = news.filter_titles(items, required_keywords=req_kw)
+
+    # Click-URL vorbereiten
+    if items:
+        click_url = _resolve_url(_item_url(items[0]))
+
+    text = _format_headlines(items)
+
+    # … Fallback EN/US, wenn leer oder schwach :contentReference[oaicite:6]{index=6}
+    if not text:
+        items = fallback.result() if fallback else news.fetch_headlines(**fallback_kw)
+        if req_kw:
+            items = news.filter_titles(items, required_keywords=req_kw)
+        if items and not click_url:
+            click_url = _resolve_url(_item_url(items[0]))
+        text = _format_headlines(items)
+
+    return ("\n\n📰 News:\n" + text if text else ""), click_url
+
+
+def _open_and_last(tk: str) -> Tuple[float, float]:
+    open_px, last_px = get_open_and_last(tk)
+    if open_px == 0:
+        raise RuntimeError(f"Open is 0 for {tk}")
+    return open_px, last_px
+
+
+def _build_alert(
+    tk: str,
+    open_px: float,
+    last_px: float,
+    pct: float,
+    news_cfg: dict | None,
+) -> Dict[str, Any]:
+    """
+    Push-Payload für einen neuen Ausbruch (inkl. News) – läuft im Thread-Pool.
+    Versand und State-Schreiben übernimmt run_once im Haupt-Thread.
+    """
+    title = _format_title(tk)
+    body = _format_body(tk, open_px, last_px, pct)
+
+    headlines_block = ""
+    click_url = None
+    if news_cfg and news_cfg.get("enabled", False):
+        headlines_block, click_url = _news_block(tk, news_cfg)
+
+    return {"title": title, "message": body + headlines_block, "click_url": click_url}
+
+
+def _push(ntfy_server: str, ntfy_topic: str, payload: Dict[str, Any], test_cfg: dict) -> None:
+    notify_ntfy(
+        ntfy_server,
+        ntfy_topic,
+        payload["title"],
+        payload["message"],
+        dry_run=bool(test_cfg.get("dry_run", False)),
+        markdown=True,
+        click_url=payload["click_url"],
+        session=_HTTP,
+    )
+
+
+def _with_link(payload: Dict[str, Any]) -> str:
+    """
+    Nachrichtentext eines Einzel-Alerts für den Sammel-Push: Click-URL als Markdown-Link
+    anhängen, falls sie nicht schon als Headline-Link im Text steht.
+    """
+    url = payload["click_url"]
+    if not url or url in payload["message"]:
+        return payload["message"]
+    return f"{payload['message']}\n\n🔗 [Artikel öffnen]({url})"
+
+
 def run_once(
     tickers: List[str],
     threshold_pct: float,
@@ -147,13 +370,15 @@ def run_once(
     market_hours_cfg: dict,
     test_cfg: dict,
     news_cfg: dict | None,
+    batch_alerts: bool = False,
 ) -> None:
     """
     Ein Durchlauf:
       - Handelszeiten prüfen (mit Test-Bypass)
-      - Je Ticker Δ% vs Open berechnen
+      - Kurse aller Ticker parallel holen, Δ% vs Open in einem Batch berechnen
       - Korridor-Logik (up/down/none) -> Push bei Richtungswechsel in/aus Korridor
       - Optional News anhängen (DE -> Fallback EN) und Click-URL setzen
+      - Optional mehrere Ausbrüche eines Durchlaufs als EIN Push (ntfy.batch_alerts, Default aus)
     """
     tz = market_hours_cfg.get("timezone") or market_hours_cfg.get("tz") or "America/New_York"
     logger.info(
@@ -177,125 +402,120 @@ def run_once(
         return
 
     state: Dict[str, str] = load_state(state_file)  # Korridor-State pro Ticker: up/down/none
+    if not tickers:
+        return
 
-    for tk in tickers:
-        try:
-            open_px, last_px = get_open_and_last(tk)
-            if open_px == 0:
-                raise RuntimeError(f"Open is 0 for {tk}")
-
-            pct = _pct_change(open_px, last_px)
+    # einmal prüfen statt pro Ticker Argumente/Formatierung für gefilterte INFO-Logs zu bauen
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    forced = None
+    if test_cfg.get("enabled") and test_cfg.get("force_delta_pct") is not None:
+        forced = float(test_cfg["force_delta_pct"])
+
+    # Netzwerk (Kurse, News) parallel im Pool; Push + State bleiben im Haupt-Thread (serialisiert)
+    dirty = False
+    try:
+        with ThreadPoolExecutor(max_workers=min(16, len(tickers))) as ex:
+            # 1) Kurse aller Ticker gleichzeitig
+            price_futures = [ex.submit(_open_and_last, tk) for tk in tickers]
+            names: List[str] = []
+            opens: List[float] = []
+            lasts: List[float] = []
+            for tk, fut in zip(tickers, price_futures):
+                try:
+                    open_px, last_px = fut.result()
+                except Exception as e:
+                    logger.error("Error while processing %s: %s", tk, e)
+                    continue
+                names.append(tk)
+                opens.append(open_px)
+                lasts.append(last_px)
+
+            # 2) Δ% aller Ticker in einem Kernel-Aufruf
+            pcts = pct_change_batch(opens, lasts)
 
             # Test: erzwungene Delta (Dozent) :contentReference[oaicite:5]{index=5}
-            if test_cfg.get("enabled") and test_cfg.get("force_delta_pct") is not None:
-                forced = float(test_cfg["force_delta_pct"])
-                logger.info("Test: force Δ%% = %.2f%% für %s (war %.2f%%).", forced, tk, pct)
-                pct = forced
-                last_px = open_px * (1.0 + pct / 100.0)
-
-            logger.info("%s | Last=%.4f Open=%.4f Δ=%+.2f%%", tk, last_px, open_px, pct)
-
-            prev = state.get(tk, "none")
-            direction = "up" if pct >= threshold_pct else "down" if pct <= -threshold_pct else "none"
-
-            if direction != "none" and direction != prev:
-                # -> neuer Ausbruch: Push
-                title = _format_title(tk)
-                body = _format_body(tk, open_px, last_px, pct)
-
-                headlines_block = ""
-                click_url = None
-
-                if news_cfg and news_cfg.get("enabled", False):
-                    # Query bauen (Name + Ticker), Keywords für Filter
-                    if news_query_for_ticker:
-                        q = news_query_for_ticker(tk)  # nutzt CompanyMeta intern
-                        # Keywords
-                        try:
-                            name, req_kw = auto_keywords(tk) if auto_keywords else ("", [])
-                        except Exception:
-                            req_kw = []
-                    else:
-                        # Build-Query direkt aus news-Modul
-                        try:
-                            name, req_kw = auto_keywords(tk) if auto_keywords else ("", [])
-                            q = news.build_query(name, tk)
-                        except Exception:
-                            q = news.build_query("", tk)
-                            req_kw = []
-
-                    # DE zuerst …
-                    items = news.fetch_headlines(
-                        query=q,
-                        limit=int(news_cfg.get("max_items", news_cfg.get("limit", 3))),
-                        lookback_hours=int(news_cfg.get("lookback_hours", 12)),
-                        lang=news_cfg.get("lang", "de"),
-                        country=news_cfg.get("country", "DE"),
-                    )
-                    if req_kw:
-                        items = news.filter_titles(items, required_keywords=req_kw)
-
-                    # Click-URL vorbereiten
-                    if items:
-                        try:
-                            from src.app.news import _extract_original_url as _news_extract
-                            click_url = _news_extract(_item_url(items[0]), resolve_redirects=True)
-                        except Exception:
-                            click_url = _item_url(items[0])
-
-                    text = _format_headlines(items)
-
-                    # … Fallback EN/US, wenn leer oder schwach :contentReference[oaicite:6]{index=6}
-                    if not text:
-                        items = news.fetch_headlines(
-                            query=q,
-                            limit=int(news_cfg.get("max_items", news_cfg.get("limit", 3))),
-                            lookback_hours=max(12, int(news_cfg.get("lookback_hours", 12))),
-                            lang=news_cfg.get("fallback_lang", "en"),
-                            country=news_cfg.get("fallback_country", "US"),
-                        )
-                        if req_kw:
-                            items = news.filter_titles(items, required_keywords=req_kw)
-                        if items and not click_url:
-                            try:
-                                from src.app.news import _extract_original_url as _news_extract
-                                click_url = _news_extract(_item_url(items[0]), resolve_redirects=True)
-                            except Exception:
-                                click_url = _item_url(items[0])
-                        text = _format_headlines(items)
-
-                    if text:
-                        headlines_block = "\n\n📰 News:\n" + text
-
-                msg = body + headlines_block
-
-                notify_ntfy(
-                    ntfy_server,
-                    ntfy_topic,
-                    title,
-                    msg,
-                    dry_run=bool(test_cfg.get("dry_run", False)),
-                    markdown=True,
-                    click_url=click_url,
-                )
-
-                state[tk] = direction
-                save_state(state_file, state)
-
-            elif direction == "none":
-                # zurück im Korridor -> Reset, damit der nächste Ausbruch wieder alertet :contentReference[oaicite:7]{index=7}
-                if prev != "none":
-                    logger.info("Back in corridor (%s): reset state %s → none", tk, prev)
+            if forced is not None:
+                for i, tk in enumerate(names):
+                    if log_info:
+                        logger.info("Test: force Δ%% = %.2f%% für %s (war %.2f%%).", forced, tk, pcts[i])
+                    pcts[i] = forced
+                    lasts[i] = opens[i] * (1.0 + forced / 100.0)
+
+            # 3) Korridor aller Ticker vektorisiert: aktuelle Codes vs. gespeicherte Codes
+            #    (int8-Arrays positionsgleich zu names); Schleife nur noch für Seiteneffekte,
+            #    nur neue Ausbrüche brauchen News + Push
+            codes = classify_codes(pcts, threshold_pct)
+            actions = corridor_actions(codes, encode_states(state, names))
+            directions = decode_codes(codes)
+            alerts: Dict[Any, Tuple[str, str]] = {}
+            for i, tk in enumerate(names):
+                open_px, last_px, pct, action = opens[i], lasts[i], pcts[i], actions[i]
+                if log_info:
+                    logger.info("%s | Last=%.4f Open=%.4f Δ=%+.2f%%", tk, last_px, open_px, pct)
+
+                if action == BREAKOUT:
+                    # -> neuer Ausbruch: Push (News im Pool)
+                    alerts[ex.submit(_build_alert, tk, open_px, last_px, pct, news_cfg)] = (tk, directions[i])
+                elif action == RESET:
+                    # zurück im Korridor -> Reset, damit der nächste Ausbruch wieder alertet :contentReference[oaicite:7]{index=7}
+                    if log_info:
+                        logger.info("Back in corridor (%s): reset state %s → none", tk, state.get(tk))
                     state[tk] = "none"
-                    save_state(state_file, state)
-                else:
+                    dirty = True
+                elif not log_info:
+                    continue
+                elif action == QUIET:
                     logger.info("%s | No alert (< ±%.2f%%).", tk, float(threshold_pct))
-
-            else:
-                logger.info("%s | Already alerted (%s). Waiting to re-enter corridor.", tk, prev)
-
-        except Exception as e:
-            logger.error("Error while processing %s: %s", tk, e)
+                else:
+                    logger.info("%s | Already alerted (%s). Waiting to re-enter corridor.", tk, state.get(tk))
+
+            # 4) Pushes, sobald die jeweiligen News da sind – oder gesammelt als EIN Push
+            batch = batch_alerts and len(alerts) > 1
+            ready: List[Tuple[str, str, Dict[str, Any]]] = []
+            for fut in as_completed(alerts):
+                tk, direction = alerts[fut]
+                try:
+                    payload = fut.result()
+                    if batch:
+                        ready.append((tk, direction, payload))
+                        continue
+                    _push(ntfy_server, ntfy_topic, payload, test_cfg)
+                    state[tk] = direction
+                    dirty = True
+                except Exception as e:
+                    logger.error("Error while processing %s: %s", tk, e)
+
+        if len(ready) > 1:
+            order = {tk: i for i, tk in enumerate(names)}
+            ready.sort(key=lambda r: order[r[0]])
+            # ntfy kennt nur EINE Click-URL -> die des ersten Tickers; die übrigen
+            # bleiben als Link im jeweiligen Abschnitt erhalten
+            combined = {
+                "title": f"Stock Alerts: {len(ready)}",
+                "message": "\n\n---\n\n".join(_with_link(payload) for _, _, payload in ready),
+                "click_url": next((payload["click_url"] for _, _, payload in ready if payload["click_url"]), None),
+            }
+            try:
+                _push(ntfy_server, ntfy_topic, combined, test_cfg)
+                for tk, direction, _ in ready:
+                    state[tk] = direction
+                dirty = True
+            except Exception as e:
+                logger.error("Error while sending combined alert (%s): %s", ",".join(r[0] for r in ready), e)
+        elif ready:
+            # nur einer übrig (Rest fehlgeschlagen) -> wie gewohnt einzeln
+            tk, direction, payload = ready[0]
+            try:
+                _push(ntfy_server, ntfy_topic, payload, test_cfg)
+                state[tk] = direction
+                dirty = True
+            except Exception as e:
+                logger.error("Error while processing %s: %s", tk, e)
+    finally:
+        # einmal pro Durchlauf schreiben (auch bei Abbruch: verschickte Alerts nicht vergessen)
+        if dirty:
+            save_state(state_file, state)
 
 
 # # import datetime as dt
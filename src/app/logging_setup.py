@@ -1,5 +1,7 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Dict, Any
 
 def setup_logging(cfg_log: Dict[str, Any]) -> logging.Logger:
@@ -9,8 +11,19 @@ def setup_logging(cfg_log: Dict[str, Any]) -> logging.Logger:
     logger = logging.getLogger("stock-alerts")
     logger.setLevel(level)
     logger.handlers.clear()
+    old = getattr(logger, "_listener", None)
+    if old is not None:  # erneuter Aufruf: alten Hintergrund-Thread sauber beenden
+        atexit.unregister(old.stop)
+        old.stop()
+        logger._listener = None
 
-    fmt = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
+    # nicht ausgegebene Record-Attribute gar nicht erst ermitteln (Thread/Prozess-Infos)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # {}-Stil + explizites datefmt (ohne Millisekunden-Anhang pro Record)
+    fmt = logging.Formatter("{asctime} | {levelname} | {message}", datefmt="%Y-%m-%d %H:%M:%S", style="{")
 
     ch = logging.StreamHandler()
     ch.setFormatter(fmt)
@@ -22,9 +35,16 @@ def setup_logging(cfg_log: Dict[str, Any]) -> logging.Logger:
             maxBytes=int(cfg_log.get("file_max_bytes", 1_000_000)),
             backupCount=int(cfg_log.get("file_backup_count", 3)),
             encoding="utf-8",
+            delay=True,  # Datei erst beim ersten Record öffnen
         )
         fh.setFormatter(fmt)
-        logger.addHandler(fh)
+        # Datei-I/O + Rotation im Hintergrund-Thread; der Aufrufer macht nur queue.put
+        q: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(q))
+        listener = QueueListener(q, fh, respect_handler_level=True)
+        listener.start()
+        logger._listener = listener
+        atexit.register(listener.stop)
 
     logger.debug("Logging initialized: level=%s, to_file=%s",
                  level_name, (cfg_log or {}).get("to_file", False))
@@ -1,10 +1,20 @@
 import time
 import yfinance as yf
 import logging
-from typing import Tuple
+from typing import Dict, List, Tuple
 
 logger = logging.getLogger("stock-alerts")
 
+try:
+    from yfinance.exceptions import YFException
+except ImportError:  # ältere yfinance-Versionen
+    YFException = RuntimeError  # type: ignore
+
+# Fehler, die ein Yahoo-Abruf realistisch werfen kann: yfinance selbst (Rate-Limit, keine Daten),
+# Netz/IO (requests- und curl_cffi-Fehler sind OSError) und kaputte Antworten (ValueError inkl.
+# JSONDecodeError). Key/Type/IndexError sind Programmierfehler und sollen sichtbar bleiben.
+YF_ERRORS = (YFException, OSError, ValueError)
+
 def get_open_and_last(ticker: str) -> Tuple[float, float]:
     for interval in ("1m", "5m", "15m"):
         for attempt in range(2):
@@ -28,6 +38,41 @@ def get_open_and_last(ticker: str) -> Tuple[float, float]:
                  ticker, open_today, last_price)
     return open_today, last_price
 
+
+def get_open_and_last_batch(tickers: List[str], interval: str = "1m") -> Dict[str, Tuple[float, float]]:
+    """
+    Open/Last für mehrere Ticker mit EINEM yf.download-Aufruf.
+    Ticker ohne verwertbare Daten fehlen im Ergebnis -> Aufrufer nutzt get_open_and_last().
+    """
+    out: Dict[str, Tuple[float, float]] = {}
+    if not tickers:
+        return out
+    try:
+        data = yf.download(
+            list(tickers), period="1d", interval=interval, group_by="ticker",
+            threads=True, progress=False, auto_adjust=False,
+        )
+    except YF_ERRORS as e:
+        logger.debug("Batch download fehlgeschlagen (%s): %s", ",".join(tickers), e)
+        return out
+    if data is None or data.empty:
+        return out
+
+    multi = getattr(data.columns, "nlevels", 1) > 1
+    for tk in tickers:
+        try:
+            df = data[tk] if multi else data
+            # Gemeinsamer Index über alle Ticker -> NaN-Zeilen je Ticker verwerfen
+            opens = df["Open"].dropna()
+            closes = df["Close"].dropna()
+            if opens.empty or closes.empty:
+                continue
+            out[tk] = (float(opens.iloc[0]), float(closes.iloc[-1]))
+            logger.debug("Batch %s: %s open=%.4f last=%.4f", tk, interval, *out[tk])
+        except KeyError:
+            continue
+    return out
+
 # import time
 # import yfinance as yf
 # import logging
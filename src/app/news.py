@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import datetime as dt
+from email.utils import parsedate_to_datetime
+import io
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 import re
 from typing import List, Tuple, Dict, Iterable
 from urllib.parse import (
-    urlparse, parse_qs, unquote, urlunparse, quote_plus
+    ParseResult, urlparse, parse_qs, unquote, urlunparse, quote_plus
 )
 
 import requests
+from requests.adapters import HTTPAdapter
 import xml.etree.ElementTree as ET
 
 logger = logging.getLogger("stock-alerts")
@@ -19,8 +24,71 @@ try:
 except Exception:  # pragma: no cover
     feedparser = None  # type: ignore
 
+# lxml (libxml2) parst RSS deutlich schneller; sonst stdlib-ElementTree
+try:
+    from lxml import etree as ET_FAST  # type: ignore
+except Exception:  # pragma: no cover
+    ET_FAST = ET  # type: ignore
+
+_XML_ERRORS = (ET.ParseError, ET_FAST.ParseError)
+
+# google-re2 (linearzeitiger DFA) für die HTML-Scans, wenn installiert; sonst re
+try:
+    import re2  # type: ignore
+except Exception:  # pragma: no cover
+    re2 = None  # type: ignore
+
+
+def _compile_linear(pattern: str, *, ignorecase: bool = False):
+    """
+    Kompiliert mit re2, falls verfügbar und das Pattern RE2-kompatibel ist; sonst re.
+    re2 nimmt keine re-Flags, sondern ein re2.Options-Objekt.
+    """
+    if re2 is not None:
+        opts = re2.Options()
+        opts.case_sensitive = not ignorecase
+        try:
+            return re2.compile(pattern, opts)
+        except re2.error:
+            # Syntax, die RE2 nicht kann (Backreferences, Lookarounds) -> re
+            pass
+    return re.compile(pattern, re.I if ignorecase else 0)
+
+
 _GOOGLE_NEWS_SEARCH = "https://news.google.com/rss/search"
 
+# Geteilte Session (keep-alive + Pool) für Feed-Abruf und URL-Auflösung;
+# Pool groß genug für die parallelen Auflösungs-Threads
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=1)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0 (compatible; stock-alerts/1.0)"})
+
+# Max. gelesene HTML-Bytes bei der URL-Auflösung (Google-Seiten sind oft 200+ KB)
+_HTML_READ_LIMIT = 64 * 1024
+# Google-Pfade, die per 3xx weiterleiten (alter RSS-Redirect, /url ohne url=-Parameter)
+_REDIRECT_PATHS = ("/__i/rss/rd/", "/url")
+# Bis zu dieser Content-Length wird der Rest verworfen statt die Verbindung zu schließen
+_DRAIN_LIMIT = 256 * 1024
+
+# Einmal kompiliert statt pro Headline neu aus dem re-Cache geholt
+# canonical / meta refresh / JS location / /url?url= in EINER Alternation -> ein Scan übers HTML;
+# genau eine Wert-Gruppe ist pro Treffer gesetzt. Ohne Backreference -> RE2-tauglich
+_RE_HTML_SIGNAL = _compile_linear(
+    r'rel=["\']canonical["\'][^>]*href=["\'](?P<canon>[^"\']+)'
+    r'|http-equiv=["\']refresh["\'][^>]*url=(?P<refresh>[^"\';>]+)'
+    r'|location\.(?:replace|href)\(["\'](?P<jsloc>[^"\']+)["\']\)'
+    r'|href=["\'](?:https?://news\.google\.com)?/url\?[^"\']*?\burl=(?P<urlp>[^"&]+)',
+    ignorecase=True,
+)
+# erste absolute URL, deren Host nicht google.* / gstatic.com ist (Lookahead statt Kandidatenliste;
+# RE2 kennt keine Lookarounds -> bleibt bei re)
+_RE_NONGOOGLE_URL = re.compile(
+    r'https?://(?!(?:[^/\s"\'<>]*\.)?(?:google\.[^/\s"\'<>]+|gstatic\.com))[^\s"\'<>]+', re.I
+)
+_RE_TRACKING = _compile_linear(r"(?:^|&)(ved|usg|utm_[^=]+|si|sca_esv|gws_[^=]+|opi)=[^&]*")
+
 
 # ---------------------------------------------------------------------------
 # Hilfsfunktionen
@@ -33,15 +101,14 @@ def _ensure_https(u: str) -> str:
     return "https://" + u.lstrip("/")
 
 
-def _clean_tracking_params(url: str) -> str:
-    """Entfernt gängige Google/UTM-Tracking-Parameter (kosmetisch)."""
+def _clean_tracking_params(url: str, parsed: ParseResult | None = None) -> str:
+    """
+    Entfernt gängige Google/UTM-Tracking-Parameter (kosmetisch).
+    `parsed`: bereits vorhandenes urlparse(url)-Ergebnis, spart erneutes Parsen.
+    """
     try:
-        p = urlparse(url)
-        clean_q = re.sub(
-            r"(?:^|&)(ved|usg|utm_[^=]+|si|sca_esv|gws_[^=]+|opi)=[^&]*",
-            "",
-            p.query or "",
-        )
+        p = parsed if parsed is not None else urlparse(url)
+        clean_q = _RE_TRACKING.sub("", p.query or "").lstrip("&")
         if clean_q != (p.query or ""):
             p = p._replace(query=clean_q)
             return urlunparse(p)
@@ -49,19 +116,53 @@ def _clean_tracking_params(url: str) -> str:
     except Exception:
         return url
 
-def _extract_original_url(url: str, *, resolve_redirects: bool = True, timeout: float = 5.0) -> str:
+def _release_for_reuse(r: requests.Response) -> None:
+    """
+    Verwirft den ungelesenen Rest eines stream=True-Bodys, damit urllib3 die Verbindung
+    in den Pool zurückgibt – ein halb gelesener Stream wird beim close() sonst geschlossen.
+    Nur bei bekannter, kleiner Content-Length; große/chunked Bodies kosten eine neue Verbindung.
+    (Hat der Prefix-Read den Body schon ganz gelesen, gibt urllib3 die Verbindung selbst frei.)
+    """
+    drain = getattr(r.raw, "drain_conn", None)
+    if drain is None:
+        return
+    try:
+        length = int(r.headers.get("Content-Length", ""))
+    except ValueError:
+        return
+    if length <= _DRAIN_LIMIT:
+        drain()
+        r.raw.release_conn()
+
+
+class _ResolveFailed(Exception):
+    """Auflösung ist an Netzwerk/HTTP gescheitert (transient); `fallback` ist die unaufgelöste URL."""
+
+    def __init__(self, fallback: str) -> None:
+        super().__init__(fallback)
+        self.fallback = fallback
+
+
+def _extract_original_url_uncached(
+    url: str,
+    *,
+    resolve_redirects: bool = True,
+    timeout: float = 5.0,
+    session: requests.Session | None = None,
+) -> str:
     """
     Liefert bestmöglich die Original-Artikel-URL.
+    Nicht-Google-Links werden ohne Request direkt (bereinigt) zurückgegeben.
     Behandelt:
       - news.google.* mit ?url=
       - consent.google.* mit ?continue=
       - /rss/articles -> /articles + HTML-Parsing
       - Redirect-Kette + canonical/meta/JS
       - Brute-Force: erste absolute Nicht-Google-URL im HTML
+    Optional `session` statt der Modul-Session (_SESSION) verwenden.
+    Wirft _ResolveFailed, wenn der Redirect-Abruf an Netzwerk/HTTP (Timeout, 429, 5xx)
+    scheitert -> solche Ergebnisse dürfen nicht gecacht werden.
     """
-    import re, requests
-    from urllib.parse import urlparse, parse_qs, unquote, urlunparse
-
     def ensure_https(u: str) -> str:
         if not u:
             return ""
@@ -69,8 +170,11 @@ def _extract_original_url(url: str, *, resolve_redirects: bool = True, timeout:
             return u
         return "https://" + u.lstrip("/")
 
-    def consent_continue(u: str) -> str | None:
-        p = urlparse(u)
+    def consent_continue(u: str, p: ParseResult | None = None) -> str | None:
+        # billiger String-Check vorab: Redirect-Ketten müssen so meist gar nicht geparst werden
+        if "consent.google." not in u:
+            return None
+        p = p if p is not None else urlparse(u)
         if "consent.google." not in (p.netloc or ""):
             return None
         qs = parse_qs(p.query or "")
@@ -81,29 +185,33 @@ def _extract_original_url(url: str, *, resolve_redirects: bool = True, timeout:
 
     url = ensure_https(url)
 
-    # 1) Direkter Google-News-Redirect (?url=)
+    # Einmal parsen; Schritte 1-4 arbeiten auf demselben Ergebnis
     try:
         p = urlparse(url)
-        if "news.google." in (p.netloc or ""):
-            qs = parse_qs(p.query or "")
-            if "url" in qs and qs["url"]:
-                return ensure_https(unquote(qs["url"][0]))
-    except Exception:
-        pass
+    except ValueError:
+        return url
+    host = (p.netloc or "").lower()
+
+    # 0) Kein Google-Host -> schon direkte Verlags-URL, kein Netzwerk-Request nötig
+    if "google." not in host:
+        return _clean_tracking_params(url, p)
+    is_gnews = "news.google." in host
+
+    # 1) Direkter Google-News-Redirect (?url=)
+    if is_gnews and "url=" in (p.query or ""):
+        qs = parse_qs(p.query)
+        if qs.get("url"):
+            return ensure_https(unquote(qs["url"][0]))
 
     # 2) Direkter Consent-Link
-    cc = consent_continue(url)
+    cc = consent_continue(url, p)
     if cc:
         return cc
 
     # 3) /rss/articles -> /articles (liefert oft Ziel-Links im HTML)
-    try:
-        p = urlparse(url)
-        if "news.google." in (p.netloc or "") and "/rss/articles/" in p.path:
-            p = p._replace(path=p.path.replace("/rss/articles/", "/articles/"))
-            url = urlunparse(p)
-    except Exception:
-        pass
+    if is_gnews and "/rss/articles/" in p.path:
+        p = p._replace(path=p.path.replace("/rss/articles/", "/articles/"))
+        url = urlunparse(p)
 
     if not resolve_redirects:
         return url
@@ -114,82 +222,126 @@ def _extract_original_url(url: str, *, resolve_redirects: bool = True, timeout:
             "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
         )
     }
-    try:
-        r = requests.get(url, allow_redirects=True, timeout=timeout, headers=headers)
-
+    def redirect_target(r) -> str | None:
         # 3a) Consent in Redirect-Kette?
         for h in (r.history or []):
             u = getattr(h, "headers", {}).get("Location", "") or h.url
             cont = consent_continue(u)
             if cont:
                 return cont
-
         # 3b) Finale URL != google.* -> fertig
-        if r.url and "google.com" not in r.url and "google." not in r.url:
+        if r.url and "google." not in r.url:
             return ensure_https(r.url)
+        return None
 
-        html = r.text or ""
-
-        # 3c) canonical / meta refresh / JS location
-        m = re.search(r'rel=["\']canonical["\'][^>]*href=["\']([^"\']+)', html, re.I)
-        if m:
-            return ensure_https(unquote(m.group(1)))
-        m = re.search(r'http-equiv=["\']refresh["\'][^>]*url=([^"\';>]+)', html, re.I)
-        if m:
-            return ensure_https(unquote(m.group(1)))
-        m = re.search(r'location\.(?:replace|href)\((["\'])(.+?)\1\)', html, re.I)
-        if m:
-            return ensure_https(unquote(m.group(2)))
-
-        # 3d) Links mit /url?url=... im HTML
-        m = re.search(r'href=["\'](?:https?://news\.google\.com)?/url\?[^"\']*?\burl=([^"&]+)', html, re.I)
-        if m:
-            return ensure_https(unquote(m.group(1)))
-
-        # 3e) BRUTE-FORCE: erste absolute Nicht-Google-URL im HTML
-        candidates = re.findall(r'https?://[^\s"\'<>]+', html, flags=re.I)
-        for cand in candidates:
-            if not re.search(r'(?:^|\.)google\.[^/]+|(?:^|\.)gstatic\.com', cand, re.I):
-                return ensure_https(unquote(cand))
-
+    sess = session or _SESSION
+    failed = False
+
+    # HEAD nur für Link-Formen, die Google per 3xx zum Verlag weiterleitet. /articles/...
+    # antwortet mit 200 + HTML-Zwischenseite -> dort wäre HEAD ein Round-Trip umsonst
+    if p.path.startswith(_REDIRECT_PATHS):
+        try:
+            target = redirect_target(
+                sess.head(url, allow_redirects=True, timeout=timeout, headers=headers)
+            )
+            if target:
+                return target
+        except requests.RequestException:
+            pass
+
+    # Sonst GET auf die Google-Zwischenseite und deren HTML auswerten
+    try:
+        with sess.get(
+            url, allow_redirects=True, timeout=timeout, headers=headers, stream=True
+        ) as r:
+            target = redirect_target(r)
+            if target:
+                return target
+
+            # Nur den Anfang lesen: canonical/meta/erste Links stehen fast immer in den ersten KB
+            raw = r.raw.read(_HTML_READ_LIMIT, decode_content=True) or b""
+            _release_for_reuse(r)
+            html = raw.decode(r.encoding or "utf-8", errors="replace")
+
+            # 3c/3d) canonical / meta refresh / JS location / Links mit /url?url=...
+            # (erstes Signal in Dokument-Reihenfolge)
+            m = _RE_HTML_SIGNAL.search(html)
+            if m:
+                return ensure_https(unquote(next(g for g in m.groups() if g)))
+
+            # 3e) BRUTE-FORCE: erste absolute Nicht-Google-URL im HTML
+            m = _RE_NONGOOGLE_URL.search(html)
+            if m:
+                return ensure_https(unquote(m.group(0)))
+
+            # Drosselung/Serverfehler: nichts gefunden, aber nur vorübergehend
+            failed = r.status_code == 429 or r.status_code >= 500
+
+    except requests.RequestException:
+        failed = True
     except Exception:
         pass
 
     # 4) Kosmetische Tracking-Parameter entfernen
+    fallback = _clean_tracking_params(url, p)
+    if failed:
+        raise _ResolveFailed(fallback)
+    return fallback
+
+
+@lru_cache(maxsize=2048)
+def _cached_resolve(url: str, session: requests.Session | None = None) -> str:
+    # _ResolveFailed geht durch den Cache durch -> Fehlschläge werden nicht gespeichert
+    return _extract_original_url_uncached(url, session=session)
+
+
+def _extract_original_url(
+    url: str,
+    *,
+    resolve_redirects: bool = True,
+    timeout: float = 5.0,
+    session: requests.Session | None = None,
+) -> str:
+    """
+    Wie _extract_original_url_uncached, aber mit LRU-Cache für Standardaufrufe:
+    dieselben Google-News-Links tauchen über viele Polling-Zyklen auf.
+    Sessions sind langlebige Modul-Objekte, der Key ist daher praktisch nur die URL.
+    Gecacht werden nur echte Auflösungen; bei Netzwerkfehlern kommt der unaufgelöste
+    Link zurück und der nächste Zyklus versucht es erneut.
+    """
     try:
-        p = urlparse(url)
-        clean_q = re.sub(r'(?:^|&)(ved|usg|utm_[^=]+|si|sca_esv|gws_[^=]+|opi)=[^&]*', '', p.query or '')
-        if clean_q != (p.query or ''):
-            p = p._replace(query=clean_q)
-            return urlunparse(p)
-    except Exception:
-        pass
+        if resolve_redirects and timeout == 5.0:
+            return _cached_resolve(url, session)
+        return _extract_original_url_uncached(
+            url, resolve_redirects=resolve_redirects, timeout=timeout, session=session
+        )
+    except _ResolveFailed as e:
+        return e.fallback
 
-    return url
 
+_FINANCE_TERMS = (
+    "stock", "Aktie", "Börse",
+    "earnings", "guidance", "outlook",
+    "revenue", "profit", "dividend",
+    "forecast", "rating", "upgrade", "downgrade",
+    "merger", "acquisition", "M&A",
+)
+_FINANCE_KW = " OR ".join(_FINANCE_TERMS)
 
 
+@lru_cache(maxsize=256)
 def build_query(name: str, ticker: str) -> str:
     """
     Erzeugt eine sinnvolle Finanz-Query für Google News.
+    Gecacht: für die feste Tickerliste ist das Ergebnis pro Zyklus identisch.
     """
     name = (name or "").strip()
     ticker = (ticker or "").strip()
-    finance_terms = [
-        "stock", "Aktie", "Börse",
-        "earnings", "guidance", "outlook",
-        "revenue", "profit", "dividend",
-        "forecast", "rating", "upgrade", "downgrade",
-        "merger", "acquisition", "M&A",
-    ]
-    kw = " OR ".join(finance_terms)
-    parts = []
-    if name:
-        parts.append(f"\"{name}\"")
+    parts = [f"\"{name}\""] if name else []
     if ticker:
         parts.append(ticker)
-    base = " OR ".join(parts) if parts else ticker
-    return f"{base} ({kw})"
+    base = " OR ".join(parts) or ticker
+    return f"{base} ({_FINANCE_KW})"
 
 
 def filter_titles(items: List[Dict[str, str]], required_keywords: Iterable[str] = ()) -> List[Dict[str, str]]:
@@ -197,23 +349,119 @@ def filter_titles(items: List[Dict[str, str]], required_keywords: Iterable[str]
     Behält nur Headlines, deren Titel eines der Keywords enthält (case-insensitive).
     Leere Keywordliste -> unverändert zurückgeben.
     """
-    req = [k.strip().lower() for k in (required_keywords or []) if k and k.strip()]
+    # sortiert + dedupliziert: gleicher Keyword-Satz -> gleicher Cache-Key, egal in welcher Reihenfolge
+    req = tuple(sorted({k.strip().lower() for k in (required_keywords or []) if k and k.strip()}))
     if not req:
         return items
-    out: List[Dict[str, str]] = []
-    for it in items:
-        title = (it.get("title") or "").lower()
-        if any(k in title for k in req):
-            out.append(it)
-    return out
+    pat = _keyword_pattern(req)
+    return [it for it in items if pat.search(it.get("title") or "")]
+
+
+@lru_cache(maxsize=256)  # ein Keyword-Satz pro Ticker
+def _keyword_pattern(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Eine kompilierte Alternation für alle Keywords (case-insensitive), je Keyword-Satz gecacht."""
+    return re.compile("|".join(map(re.escape, keywords)), re.I)
 
 
+@lru_cache(maxsize=16)
+def _locale_suffix(lang: str, country: str) -> str:
+    """Fester hl/gl/ceid-Teil der RSS-URL je Sprache/Land."""
+    return f"&hl={lang}&gl={country}&ceid={country}:{lang}"
+
+
+@lru_cache(maxsize=512)
 def _google_news_rss_url(query: str, lang: str = "de", country: str = "DE") -> str:
     """
-    Baut die Google-News-RSS-URL.
+    Baut die Google-News-RSS-URL (gecacht: dieselben Queries laufen jeden Zyklus).
+    """
+    return f"{_GOOGLE_NEWS_SEARCH}?q={quote_plus(query)}{_locale_suffix(lang, country)}"
+
+
+def _iter_rss_items(content: bytes):
+    """
+    Liefert die <item>-Elemente eines RSS-Feeds inkrementell (iterparse) und gibt sie
+    danach wieder frei. Abbruch per break spart das Parsen des restlichen Feeds.
+    """
+    if ET_FAST is ET:
+        events = ET.iterparse(io.BytesIO(content), events=("end",))
+    else:
+        events = ET_FAST.iterparse(io.BytesIO(content), events=("end",), tag="item")
+    for _, elem in events:
+        if elem.tag != "item":
+            continue
+        yield elem
+        elem.clear()
+
+
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+_UTC_ZONES = frozenset(("GMT", "UTC", "UT", "Z", "+0000", "-0000"))
+
+
+def _parse_rfc822(s: str) -> dt.datetime:
+    """
+    Schneller Parser für Google-News-pubDates ("Mon, 14 Oct 2026 10:00:00 GMT").
+    Unbekannte Formate/Zeitzonen gehen an email.utils.parsedate_to_datetime.
+    """
+    parts = s.split()
+    try:
+        if len(parts) == 6 and parts[5] in _UTC_ZONES:
+            h, m, sec = parts[4].split(":")
+            return dt.datetime(
+                int(parts[3]), _MONTHS[parts[2]], int(parts[1]),
+                int(h), int(m), int(sec), tzinfo=dt.timezone.utc,
+            )
+    except (KeyError, ValueError):
+        pass
+    return parsedate_to_datetime(s)
+
+
+_NS_SOURCE = "{http://news.google.com}source"
+_ITEM_TAGS = frozenset(("title", "link", "source", _NS_SOURCE, "pubDate"))
+
+
+def _item_fields(item) -> Dict[str, str]:
+    """
+    Liest title/link/source/pubDate eines <item> in EINEM Durchlauf über die Kinder
+    (statt je Feld ein find()). Pro Tag zählt der erste NICHT-leere Wert; leere Tags
+    (z. B. <source/>) fehlen im Ergebnis, damit die Aufrufer auf die nächste Variante
+    (namespaced source, Default) zurückfallen.
+    """
+    d: Dict[str, str] = {}
+    for c in item:
+        t = c.tag
+        if t in _ITEM_TAGS and t not in d:
+            text = (c.text or "").strip()
+            if text:
+                d[t] = text
+    return d
+
+
+def _resolve_pending(
+    pending: List[Tuple[Dict[str, str], str]],
+    session: requests.Session | None = None,
+) -> List[Dict[str, str]]:
     """
-    q = quote_plus(query)
-    return f"{_GOOGLE_NEWS_SEARCH}?q={q}&hl={lang}&gl={country}&ceid={country}:{lang}"
+    Löst die Original-URLs aller gesammelten Headlines parallel auf (je ein HTTP-Request,
+    I/O-bound) -> Wartezeit ≈ langsamste Auflösung statt Summe.
+    """
+    if not pending:
+        return []
+    links = [link for _, link in pending]
+
+    def _resolve(link: str) -> str:
+        return _extract_original_url(link, session=session)
+
+    if len(links) == 1:
+        urls = [_resolve(links[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(links))) as ex:
+            urls = list(ex.map(_resolve, links))
+    for (item, _), url in zip(pending, urls):
+        item["url"] = url
+    return [item for item, _ in pending]
 
 
 # ---------------------------------------------------------------------------
@@ -225,99 +473,130 @@ def fetch_headlines(
     lookback_hours: int = 12,
     lang: str = "de",
     country: str = "DE",
+    session: requests.Session | None = None,
 ) -> List[Dict[str, str]]:
     """
     Holt aktuelle Headlines aus Google News RSS für die Query.
     Gibt Dicts mit 'title', 'source', 'url', 'published' zurück.
     Nutzt feedparser, fällt sonst auf requests+ET zurück.
+    Optional `session` statt der Modul-Session (_SESSION) für Feed und URL-Auflösung.
     """
     # Zeitfenster in der Query ausdrücken
     q = f"{query} when:{int(lookback_hours)}h"
     url = _google_news_rss_url(q, lang=lang, country=country)
 
-    out: List[Dict[str, str]] = []
+    limit = int(limit)
+    if limit <= 0:
+        return []
+
+    # erst alle Treffer sammeln (Zeitfenster/Limit), dann die URLs gemeinsam auflösen;
+    # billige Prüfungen (Titel/Link) vor dem Datum, Abbruch sobald `limit` erreicht ist
+    pending: List[Tuple[Dict[str, str], str]] = []
     now_utc = dt.datetime.now(dt.timezone.utc)
+    max_age_s = lookback_hours * 3600
 
     if feedparser is not None:
-        # Weg A: feedparser
-        feed = feedparser.parse(url)
+        # Weg A: feedparser (Feed über die Session laden, feedparser parst nur)
+        try:
+            r = (session or _SESSION).get(url, timeout=15)
+            r.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning("News abrufen fehlgeschlagen (%s): %s", query, e)
+            return []
+        feed = feedparser.parse(r.content)
+        append = pending.append
+        utc = dt.timezone.utc
         for e in feed.entries:
-            title = getattr(e, "title", "").strip()
-            link = getattr(e, "link", "").strip()
-            source = ""
-            try:
-                source = getattr(getattr(e, "source", None), "title", "") or ""
-            except Exception:
-                source = ""
-            pub_dt_utc = None
-            if getattr(e, "published_parsed", None):
-                pub_dt_utc = dt.datetime(*e.published_parsed[:6], tzinfo=dt.timezone.utc)
-
-            if pub_dt_utc:
-                age = now_utc - pub_dt_utc
-                if age.total_seconds() > lookback_hours * 3600:
-                    continue
-
-            if title and link:
-                out.append({
-                    "title": title,
-                    "source": source or "news.google.com",
-                    "url": _extract_original_url(link),
-                    "published": pub_dt_utc.isoformat().replace("+00:00", "Z") if pub_dt_utc else "",
-                })
-            if len(out) >= int(limit):
+            # FeedParserDict ist ein dict -> .get statt getattr-Ketten
+            title = (e.get("title") or "").strip()
+            link = (e.get("link") or "").strip()
+            if not (title and link):
+                continue
+            src = e.get("source")
+            source = (src.get("title") if isinstance(src, dict) else "") or ""
+            pp = e.get("published_parsed")
+            pub_dt_utc = dt.datetime(*pp[:6], tzinfo=utc) if pp else None
+
+            if pub_dt_utc and (now_utc - pub_dt_utc).total_seconds() > max_age_s:
+                continue
+
+            append(({
+                "title": title,
+                "source": source or "news.google.com",
+                "url": "",
+                "published": pub_dt_utc.isoformat().replace("+00:00", "Z") if pub_dt_utc else "",
+            }, link))
+            if len(pending) >= limit:
                 break
-        return out
+        return _resolve_pending(pending, session)
 
     # Weg B: Fallback ohne feedparser
     try:
-        r = requests.get(url, timeout=15)
+        r = (session or _SESSION).get(url, timeout=15)
         r.raise_for_status()
-        root = ET.fromstring(r.content)
-
-        def _findtext(elem, *names):
-            for n in names:
-                x = elem.find(n)
-                if x is not None and (x.text or "").strip():
-                    return (x.text or "").strip()
-            return ""
-
-        # pubDate parsen (Fallback)
-        from email.utils import parsedate_to_datetime
 
-        for item in root.findall(".//item"):
-            title = _findtext(item, "title")
-            link = _findtext(item, "link")
+        for item in _iter_rss_items(r.content):
+            f = _item_fields(item)
+            title = f.get("title", "")
+            link = f.get("link", "")
+            if not (title and link):
+                continue
             # Source steht je nach Feed als <source> oder namespaced
-            source = _findtext(item, "source", "{http://news.google.com}source") or "news.google.com"
-            pub_raw = _findtext(item, "pubDate")
+            source = f.get("source") or f.get(_NS_SOURCE) or "news.google.com"
+            pub_raw = f.get("pubDate", "")
             pub_iso = ""
             if pub_raw:
                 try:
-                    pub_dt = parsedate_to_datetime(pub_raw)
+                    pub_dt = _parse_rfc822(pub_raw)
                     if pub_dt.tzinfo is None:
                         pub_dt = pub_dt.replace(tzinfo=dt.timezone.utc)
                     pub_iso = pub_dt.astimezone(dt.timezone.utc).isoformat().replace("+00:00", "Z")
-                    if (now_utc - pub_dt.astimezone(dt.timezone.utc)).total_seconds() > lookback_hours * 3600:
+                    if (now_utc - pub_dt.astimezone(dt.timezone.utc)).total_seconds() > max_age_s:
                         continue
                 except Exception:
                     pass
 
-            if title and link:
-                out.append({
-                    "title": title,
-                    "source": source,
-                    "url": _extract_original_url(link),
-                    "published": pub_iso,
-                })
-            if len(out) >= int(limit):
+            pending.append(({
+                "title": title,
+                "source": source,
+                "url": "",
+                "published": pub_iso,
+            }, link))
+            if len(pending) >= limit:
                 break
-        return out
+        return _resolve_pending(pending, session)
     except Exception as e:  # pragma: no cover
         logger.warning("News abrufen fehlgeschlagen (%s): %s", query, e)
         return []
 
 
+def fetch_headlines_batch(
+    queries: Dict[str, str],
+    *,
+    max_workers: int = 8,
+    **kwargs,
+) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Holt Headlines für mehrere Queries gleichzeitig (Thread-Pool, I/O-bound).
+    queries: Schlüssel (z. B. Ticker) -> Query; kwargs wie fetch_headlines.
+    Ein Fehler bei einer Query liefert dort [] statt den ganzen Batch abzubrechen.
+    """
+    if not queries:
+        return {}
+
+    def _one(query: str) -> List[Dict[str, str]]:
+        try:
+            return fetch_headlines(query, **kwargs)
+        except (requests.RequestException, *_XML_ERRORS, OSError, ValueError) as e:
+            logger.warning("News abrufen fehlgeschlagen (%s): %s", query, e)
+            return []
+
+    keys = list(queries)
+    workers = max(1, min(max_workers, len(keys)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return dict(zip(keys, ex.map(_one, (queries[k] for k in keys))))
+
+
 # ---------------------------------------------------------------------------
 # Optionale Tuple-Variante (falls mal benötigt)
 # ---------------------------------------------------------------------------
@@ -333,16 +612,15 @@ def fetch_news(query: str, *, max_items: int = 3, lang: str = "de") -> List[Tupl
         "ceid": f"{'DE' if lang == 'de' else 'US'}:{lang}",
     }
     try:
-        r = requests.get(_GOOGLE_NEWS_SEARCH, params=params, timeout=15)
+        r = _SESSION.get(_GOOGLE_NEWS_SEARCH, params=params, timeout=15)
         r.raise_for_status()
-        root = ET.fromstring(r.content)
         items: List[Tuple[str, str, str]] = []
-        for item in root.findall(".//item"):
-            title = (item.findtext("title") or "").strip()
-            link = (item.findtext("link") or "").strip()
+        for item in _iter_rss_items(r.content):
+            f = _item_fields(item)
+            title = f.get("title", "")
+            link = f.get("link", "")
             # Quelle kann im Google-Namespace liegen
-            src = (item.findtext("{http://news.google.com}source") or
-                   item.findtext("source") or "").strip()
+            src = f.get(_NS_SOURCE) or f.get("source") or ""
             if title and link:
                 items.append((title, src or "news.google.com", _extract_original_url(link)))
             if len(items) >= max_items:
@@ -103,8 +103,12 @@ def notify_ntfy(
     dry_run: bool = False,
     markdown: bool = False,
     click_url: str | None = None,
+    session: requests.Session | None = None,
 ) -> None:
-    """Send a push notification via ntfy.sh (Header latin-1-sicher)."""
+    """
+    Send a push notification via ntfy.sh (Header latin-1-sicher).
+    Optional `session` reuses an existing requests.Session (keep-alive).
+    """
     url = f"{server.rstrip('/')}/{topic}"
 
     if dry_run:
@@ -118,7 +122,7 @@ def notify_ntfy(
         headers["Click"] = click_url  # nur ASCII verwenden
 
     try:
-        r = requests.post(url, data=message.encode("utf-8"), headers=headers, timeout=20)
+        r = (session or requests).post(url, data=message.encode("utf-8"), headers=headers, timeout=20)
         r.raise_for_status()
         logger.info("ntfy sent to %s (%s)", mask_secret(topic), r.status_code)
     except requests.RequestException as e:
@@ -1,15 +1,21 @@
-import json
+import hashlib
 import logging
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
+
+from src.app.utils import json_dumps, json_loads
 
 logger = logging.getLogger("stock-alerts")
 
+# path -> (hash of last written payload, mtime_ns after writing it)
+_last_written: Dict[str, Tuple[str, int]] = {}
+
 def load_state(path: Path) -> Dict[str, str]:
     """Load the last alert state from a JSON file."""
     if path.exists():
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = json_loads(path.read_bytes())
             if isinstance(data, dict):
                 logger.debug("Loaded state from %s: %s", path, data)
                 return data
@@ -18,8 +24,23 @@ def load_state(path: Path) -> Dict[str, str]:
     return {}
 
 def save_state(path: Path, state: Dict[str, str]) -> None:
-    """Save the current alert state to disk."""
-    path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+    """Save the current alert state to disk (atomic; skipped if nothing changed)."""
+    payload = json_dumps(state, indent=True)
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    key = str(path)
+    prev = _last_written.get(key)
+    if prev is not None and prev[0] == digest:
+        try:
+            # only skip if nobody else has touched the file since our last write
+            if path.stat().st_mtime_ns == prev[1]:
+                logger.debug("State unchanged, not rewriting %s", path)
+                return
+        except OSError:
+            pass
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+    _last_written[key] = (digest, path.stat().st_mtime_ns)
     logger.debug("Saved state to %s: %s", path, state)
 
 
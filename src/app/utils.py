@@ -1,4 +1,13 @@
+from __future__ import annotations
 
+import json
+from typing import Any
+
+# orjson (Rust) ist deutlich schneller als json – optional, sonst Standardbibliothek
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
 
 def mask_secret(s: str, keep: int = 1) -> str:
     """Maskiert sensible Strings für Logging-Ausgaben."""
@@ -13,3 +22,18 @@ def mask_secret(s: str, keep: int = 1) -> str:
     return s[:keep] + "..." + s[-keep:] 
 
 # Andernfalls gib den ersten und letzten Buchstaben mit Ellipse dazwischen aus
+
+
+def json_dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialisiert nach UTF-8-JSON-Bytes (orjson, falls installiert; sonst json)."""
+    if orjson is not None:
+        opt = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=opt)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parst JSON aus Bytes oder str (orjson, falls installiert; sonst json)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -10,7 +10,7 @@ CONFIG_PATH = Path("config.json")
 DEFAULT_CFG = {
     "tickers": ["AAPL", "O", "WPY.F", "QDVX.DE"],
     "threshold_pct": 1.0,
-    "ntfy": {"server": "https://ntfy.sh", "topic": "${NTFY_TOPIC}"},
+    "ntfy": {"server": "https://ntfy.sh", "topic": "${NTFY_TOPIC}", "batch_alerts": False},
     "log": {"level": "${LOG_LEVEL:INFO}", "file": "alerts.log"},
     "state_file": "alert_state.json",
     "market_hours": {
@@ -38,6 +38,9 @@ DEFAULT_CFG = {
     }
 }
 
+# Streamlit führt das Skript bei jeder Interaktion neu aus -> Config nicht jedes Mal von Platte lesen
+# (kurze TTL für Änderungen von außen; nach dem Speichern wird explizit geleert)
+@st.cache_data(ttl=5)
 def read_raw_config() -> dict:
     if CONFIG_PATH.exists():
         try:
@@ -49,6 +52,12 @@ def read_raw_config() -> dict:
 def write_config(cfg: dict) -> None:
     CONFIG_PATH.write_text(json.dumps(cfg, ensure_ascii=False, indent=2), encoding="utf-8")
 
+@st.cache_resource
+def _requests_session():
+    # eine Session über alle Reruns -> TLS-Verbindung zum ntfy-Server wird wiederverwendet
+    import requests
+    return requests.Session()
+
 def hhmm_to_time(s: str) -> dtime:
     hh, mm = (s or "09:30").split(":")
     return dtime(int(hh), int(mm))
@@ -59,113 +68,163 @@ def time_to_hhmm(t: dtime) -> str:
 st.set_page_config(page_title="Stock Notifier – Einstellungen", page_icon="🛠️", layout="centered")
 st.title("⚙️ Stock Notifier – Konfiguration")
 
-cfg = read_raw_config()
-tabs = st.tabs(["Allgemein", "Benachrichtigung", "Logging", "Marktzeiten", "News", "Test/Debug"])
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+DAY_LABELS = [(1,"Mo"),(2,"Di"),(3,"Mi"),(4,"Do"),(5,"Fr"),(6,"Sa"),(7,"So")]
+
+def widget_state(cfg: dict) -> dict:
+    """Startwerte aller Widgets (session_state-Keys) aus der Config."""
+    ntfy = cfg.get("ntfy", {})
+    log = cfg.get("log", {})
+    mh = cfg.get("market_hours", {})
+    nw = cfg.get("news", {})
+    tc = cfg.get("test", {})
+    level = str(log.get("level", "INFO")).split(":")[-1]
+    return {
+        "tickers_text": ",".join(cfg.get("tickers", [])),
+        "threshold": float(cfg.get("threshold_pct", 1.0)),
+        "ntfy_server": ntfy.get("server", "https://ntfy.sh"),
+        "ntfy_topic": ntfy.get("topic", "${NTFY_TOPIC}"),
+        "ntfy_batch": bool(ntfy.get("batch_alerts", False)),
+        "level": level if level in LOG_LEVELS else "INFO",
+        "log_file": log.get("file", "alerts.log"),
+        "tz": mh.get("timezone", "America/New_York"),
+        "open_time": hhmm_to_time(mh.get("open", "09:30")),
+        "close_time": hhmm_to_time(mh.get("close", "16:00")),
+        "sel_days": list(mh.get("active_days", [1,2,3,4,5])),
+        "pause": bool(mh.get("pause_on_closed", True)),
+        "news_enabled": bool(nw.get("enabled", True)),
+        "news_limit": int(nw.get("max_items", 3)),
+        "news_lookback": int(nw.get("lookback_hours", 12)),
+        "news_lang": nw.get("lang", "de"),
+        "news_country": nw.get("country", "DE"),
+        "fb_lang": nw.get("fallback_lang", "en"),
+        "fb_country": nw.get("fallback_country", "US"),
+        "t_enabled": bool(tc.get("enabled", True)),
+        "t_dry": bool(tc.get("dry_run", False)),
+        "t_bypass": bool(tc.get("bypass_market_hours", False)),
+        "t_force": "" if tc.get("force_delta_pct") in (None,"") else str(tc.get("force_delta_pct")),
+        "t_force_out": bool(tc.get("force_run_outside_hours", False)),
+    }
+
+# Jeder Tab als Fragment: eine Interaktion führt nur den betroffenen Tab neu aus statt das ganze Skript.
+# Werte stehen über die Widget-Keys in st.session_state (befüllt aus widget_state), "Speichern" liest von dort.
+# (st.fragment ab Streamlit 1.37, davor experimental_fragment; ganz alt: normale Funktion)
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda f: f)
 
 # --- Allgemein ---
-with tabs[0]:
-    tickers_text = st.text_area(
-        "Ticker (kommagetrennt)", value=",".join(cfg.get("tickers", [])),
-        help="Beispiele: AAPL, MSFT, NVDA, O, SAP.DE"
-    )
-    threshold = st.number_input("Schwelle Δ% vs. Open", min_value=0.01, max_value=50.0,
-                                step=0.01, value=float(cfg.get("threshold_pct", 1.0)))
+@_fragment
+def _tab_allgemein() -> None:
+    st.text_area("Ticker (kommagetrennt)", help="Beispiele: AAPL, MSFT, NVDA, O, SAP.DE", key="tickers_text")
+    st.number_input("Schwelle Δ% vs. Open", min_value=0.01, max_value=50.0, step=0.01, key="threshold")
     st.caption("Hinweis: Sehr niedrige Schwellen erzeugen viele Benachrichtigungen.")
 
 # --- Benachrichtigung ---
-with tabs[1]:
-    ntfy = cfg.get("ntfy", {})
-    ntfy_server = st.text_input("ntfy Server", ntfy.get("server", "https://ntfy.sh"))
-    ntfy_topic = st.text_input("ntfy Topic", ntfy.get("topic", "${NTFY_TOPIC}"),
-                               help="Tipp: '${NTFY_TOPIC}' belassen und Topic als GitHub Secret setzen.")
+@_fragment
+def _tab_benachrichtigung() -> None:
+    ntfy_server = st.text_input("ntfy Server", key="ntfy_server")
+    ntfy_topic = st.text_input("ntfy Topic",
+                               help="Tipp: '${NTFY_TOPIC}' belassen und Topic als GitHub Secret setzen.",
+                               key="ntfy_topic")
+    st.checkbox("Ausbrüche eines Durchlaufs als EIN Push", key="ntfy_batch")
     if st.button("🔔 Testbenachrichtigung senden"):
         # einfacher Test ohne App-Importe
-        import requests
         title = "Config Test"
         body = "Hallo von der Streamlit-UI 👋"
         try:
-            r = requests.post(ntfy_server.rstrip("/") + "/" + ntfy_topic, data=body.encode("utf-8"),
-                              headers={"Title": title, "Priority": "default", "Markdown": "yes"}, timeout=15)
+            r = _requests_session().post(ntfy_server.rstrip("/") + "/" + ntfy_topic, data=body.encode("utf-8"),
+                                         headers={"Title": title, "Priority": "default", "Markdown": "yes"}, timeout=15)
             st.success(f"ntfy Antwort: {r.status_code}")
         except Exception as e:
             st.error(f"Fehler: {e}")
 
 # --- Logging ---
-with tabs[2]:
-    log = cfg.get("log", {})
-    level = st.selectbox("Log Level", ["DEBUG", "INFO", "WARNING", "ERROR"],
-                         index=["DEBUG","INFO","WARNING","ERROR"].index(str(log.get("level", "INFO")).split(":")[-1]))
-    log_file = st.text_input("Log Datei", log.get("file", "alerts.log"))
+@_fragment
+def _tab_logging() -> None:
+    st.selectbox("Log Level", LOG_LEVELS, key="level")
+    st.text_input("Log Datei", key="log_file")
 
 # --- Marktzeiten ---
-with tabs[3]:
-    mh = cfg.get("market_hours", {})
-    tz = st.text_input("Zeitzone", mh.get("timezone", "America/New_York"),
-                       help="IANA Timezone, z. B. Europe/Berlin oder America/New_York")
-    open_time = st.time_input("Börsenstart (hh:mm)", value=hhmm_to_time(mh.get("open", "09:30")))
-    close_time = st.time_input("Börsenschluss (hh:mm)", value=hhmm_to_time(mh.get("close", "16:00")))
-    day_labels = [(1,"Mo"),(2,"Di"),(3,"Mi"),(4,"Do"),(5,"Fr"),(6,"Sa"),(7,"So")]
-    sel_days = st.multiselect("Aktive Tage", options=[d for d,_ in day_labels],
-                              default=list(mh.get("active_days", [1,2,3,4,5])),
-                              format_func=lambda x: dict(day_labels)[x])
-    pause = st.checkbox("Außerhalb der Marktzeiten pausieren", value=bool(mh.get("pause_on_closed", True)))
+@_fragment
+def _tab_marktzeiten() -> None:
+    st.text_input("Zeitzone", help="IANA Timezone, z. B. Europe/Berlin oder America/New_York", key="tz")
+    st.time_input("Börsenstart (hh:mm)", key="open_time")
+    st.time_input("Börsenschluss (hh:mm)", key="close_time")
+    st.multiselect("Aktive Tage", options=[d for d,_ in DAY_LABELS],
+                   format_func=lambda x: dict(DAY_LABELS)[x], key="sel_days")
+    st.checkbox("Außerhalb der Marktzeiten pausieren", key="pause")
 
 # --- News ---
-with tabs[4]:
-    nw = cfg.get("news", {})
-    news_enabled = st.checkbox("News anfügen", value=bool(nw.get("enabled", True)))
-    news_limit = st.slider("Max. Headlines", min_value=0, max_value=5, value=int(nw.get("max_items", 3)))
-    news_lookback = st.slider("Zeitraum (Stunden)", min_value=6, max_value=48, value=int(nw.get("lookback_hours", 12)))
+@_fragment
+def _tab_news() -> None:
+    st.checkbox("News anfügen", key="news_enabled")
+    st.slider("Max. Headlines", min_value=0, max_value=5, key="news_limit")
+    st.slider("Zeitraum (Stunden)", min_value=6, max_value=48, key="news_lookback")
     col1, col2 = st.columns(2)
     with col1:
-        news_lang = st.text_input("Sprache (primär)", nw.get("lang", "de"))
-        news_country = st.text_input("Land (primär)", nw.get("country", "DE"))
+        st.text_input("Sprache (primär)", key="news_lang")
+        st.text_input("Land (primär)", key="news_country")
     with col2:
-        fb_lang = st.text_input("Fallback-Sprache", nw.get("fallback_lang", "en"))
-        fb_country = st.text_input("Fallback-Land", nw.get("fallback_country", "US"))
+        st.text_input("Fallback-Sprache", key="fb_lang")
+        st.text_input("Fallback-Land", key="fb_country")
 
 # --- Test/Debug ---
-with tabs[5]:
-    tc = cfg.get("test", {})
-    t_enabled = st.checkbox("Testmodus aktiv", value=bool(tc.get("enabled", True)))
-    t_dry = st.checkbox("Dry-Run (kein Versand)", value=bool(tc.get("dry_run", False)))
-    t_bypass = st.checkbox("Market Hours ignorieren", value=bool(tc.get("bypass_market_hours", False)))
-    t_force = st.text_input("Erzwinge Δ% (leer = aus)", value="" if tc.get("force_delta_pct") in (None,"") else str(tc.get("force_delta_pct")))
-    t_force_out = st.checkbox("force_run_outside_hours (Legacy)", value=bool(tc.get("force_run_outside_hours", False)))
+@_fragment
+def _tab_test() -> None:
+    st.checkbox("Testmodus aktiv", key="t_enabled")
+    st.checkbox("Dry-Run (kein Versand)", key="t_dry")
+    st.checkbox("Market Hours ignorieren", key="t_bypass")
+    st.text_input("Erzwinge Δ% (leer = aus)", key="t_force")
+    st.checkbox("force_run_outside_hours (Legacy)", key="t_force_out")
+
+cfg = read_raw_config()
+# Widgets mit key= ignorieren geänderte Startwerte und behalten ihren session_state-Wert ->
+# bei neuer Config (erster Lauf, nach dem Speichern, Änderung von außen) die Keys neu befüllen.
+# Muss vor dem Rendern passieren: instanziierte Widget-Keys darf man im selben Lauf nicht setzen.
+if st.session_state.get("_cfg_loaded") != cfg:
+    st.session_state.update(widget_state(cfg))
+    st.session_state["_cfg_loaded"] = cfg
+
+tabs = st.tabs(["Allgemein", "Benachrichtigung", "Logging", "Marktzeiten", "News", "Test/Debug"])
+for tab, render in zip(tabs, (_tab_allgemein, _tab_benachrichtigung, _tab_logging,
+                              _tab_marktzeiten, _tab_news, _tab_test)):
+    with tab:
+        render()
 
 st.divider()
 if st.button("💾 Speichern"):
+    ss = st.session_state
     new_cfg = {
-        "tickers": [t.strip() for t in tickers_text.split(",") if t.strip()],
-        "threshold_pct": float(threshold),
-        "ntfy": {"server": ntfy_server, "topic": ntfy_topic},
-        "log": {"level": level, "file": log_file},
+        "tickers": [t.strip() for t in ss["tickers_text"].split(",") if t.strip()],
+        "threshold_pct": float(ss["threshold"]),
+        "ntfy": {"server": ss["ntfy_server"], "topic": ss["ntfy_topic"], "batch_alerts": bool(ss["ntfy_batch"])},
+        "log": {"level": ss["level"], "file": ss["log_file"]},
         "state_file": cfg.get("state_file", "alert_state.json"),
         "market_hours": {
-            "timezone": tz,
-            "open": time_to_hhmm(open_time),
-            "close": time_to_hhmm(close_time),
-            "active_days": [int(d) for d in sel_days],
-            "pause_on_closed": bool(pause),
+            "timezone": ss["tz"],
+            "open": time_to_hhmm(ss["open_time"]),
+            "close": time_to_hhmm(ss["close_time"]),
+            "active_days": [int(d) for d in ss["sel_days"]],
+            "pause_on_closed": bool(ss["pause"]),
         },
         "test": {
-            "enabled": bool(t_enabled),
-            "dry_run": bool(t_dry),
-            "bypass_market_hours": bool(t_bypass),
-            "force_delta_pct": None if (t_force.strip() == "") else float(t_force),
-            "force_run_outside_hours": bool(t_force_out),
+            "enabled": bool(ss["t_enabled"]),
+            "dry_run": bool(ss["t_dry"]),
+            "bypass_market_hours": bool(ss["t_bypass"]),
+            "force_delta_pct": None if (ss["t_force"].strip() == "") else float(ss["t_force"]),
+            "force_run_outside_hours": bool(ss["t_force_out"]),
         },
         "news": {
-            "enabled": bool(news_enabled),
-            "max_items": int(news_limit),
-            "lookback_hours": int(news_lookback),
-            "lang": news_lang,
-            "country": news_country,
-            "fallback_lang": fb_lang,
-            "fallback_country": fb_country,
+            "enabled": bool(ss["news_enabled"]),
+            "max_items": int(ss["news_limit"]),
+            "lookback_hours": int(ss["news_lookback"]),
+            "lang": ss["news_lang"],
+            "country": ss["news_country"],
+            "fallback_lang": ss["fb_lang"],
+            "fallback_country": ss["fb_country"],
         },
     }
     write_config(new_cfg)
+    read_raw_config.clear()  # nächster Lauf liest neu; weicht die Datei ab, befüllt er die Widgets neu
     st.success("Konfiguration gespeichert.")
     st.code(json.dumps(new_cfg, ensure_ascii=False, indent=2), language="json")
 
@@ -0,0 +1,24 @@
+import unittest
+
+from src.app.company import _strip_legal_suffixes
+
+
+class StripLegalSuffixesTest(unittest.TestCase):
+    def test_strips_trailing_legal_forms(self):
+        self.assertEqual(_strip_legal_suffixes("Apple Inc."), "Apple")
+        self.assertEqual(_strip_legal_suffixes("SAP SE"), "SAP")
+        self.assertEqual(_strip_legal_suffixes("Foo Holdings, Ltd."), "Foo")
+        self.assertEqual(_strip_legal_suffixes("W. P. Carey Inc."), "W. P. Carey")
+
+    def test_keeps_names_made_only_of_suffix_words(self):
+        # wie bisher: bliebe nur ein Suffix-Wort übrig, bleibt der volle Name stehen
+        self.assertEqual(_strip_legal_suffixes("Holdings Inc"), "Holdings Inc")
+        self.assertEqual(_strip_legal_suffixes("Company Inc"), "Company Inc")
+        self.assertEqual(_strip_legal_suffixes("Inc."), "Inc.")
+
+    def test_empty(self):
+        self.assertEqual(_strip_legal_suffixes(""), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
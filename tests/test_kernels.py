@@ -0,0 +1,178 @@
+import contextlib
+import datetime as dt
+import unittest
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from src.app import _kernels as K
+from src.app import core
+
+
+# Referenzen: die Logik von run_once/is_market_hours vor den Kerneln
+def _old_pct_change(open_price, last_price):
+    if not open_price:
+        return 0.0
+    return (last_price - open_price) / open_price * 100.0
+
+
+def _old_direction(pct, threshold_pct):
+    return "up" if pct >= threshold_pct else "down" if pct <= -threshold_pct else "none"
+
+
+def _old_action(direction, prev):
+    if direction != "none" and direction != prev:
+        return K.BREAKOUT
+    if direction != "none":
+        return K.HELD
+    return K.RESET if prev != "none" else K.QUIET
+
+
+def _old_market_hours(n, open_s, close_s, active_days):
+    open_hh, open_mm = map(int, open_s.split(":"))
+    close_hh, close_mm = map(int, close_s.split(":"))
+    wk = n.weekday() + 1
+    if active_days and wk not in active_days:
+        return False
+    start = n.replace(hour=open_hh, minute=open_mm, second=0, microsecond=0)
+    end = n.replace(hour=close_hh, minute=close_mm, second=0, microsecond=0)
+    return start <= n <= end
+
+
+class KernelPathsMixin:
+    """Jeden Test für alle drei Pfade laufen lassen: reines Python, NumPy, Kernel (numba/@njit)."""
+
+    def paths(self):
+        yield "python", {"np": None, "HAVE_NUMBA": False}
+        if K.np is not None:
+            yield "numpy", {"HAVE_NUMBA": False}
+            # ohne numba läuft derselbe Kernel-Code unkompiliert
+            yield "kernel", {"HAVE_NUMBA": True}
+
+    @contextlib.contextmanager
+    def on_path(self, overrides):
+        with contextlib.ExitStack() as stack:
+            for name, value in overrides.items():
+                stack.enter_context(mock.patch.object(K, name, value))
+            yield
+
+
+class PctChangeBatchTest(KernelPathsMixin, unittest.TestCase):
+    OPENS = [100.0, 100.0, 0.0, 50.0, 3.5, 0.0]
+    LASTS = [105.0, 90.0, 12.0, 50.0, 3.4, 0.0]
+
+    def test_matches_old_pct_change(self):
+        expected = [_old_pct_change(o, l) for o, l in zip(self.OPENS, self.LASTS)]
+        for name, overrides in self.paths():
+            with self.subTest(path=name), self.on_path(overrides):
+                got = K.pct_change_batch(self.OPENS, self.LASTS)
+                self.assertEqual(len(got), len(expected))
+                for g, e in zip(got, expected):
+                    self.assertAlmostEqual(g, e, places=12)
+
+    def test_open_zero_is_zero(self):
+        for name, overrides in self.paths():
+            with self.subTest(path=name), self.on_path(overrides):
+                self.assertEqual(K.pct_change_batch([0.0, 0.0], [5.0, -5.0]), [0.0, 0.0])
+
+    def test_empty(self):
+        for name, overrides in self.paths():
+            with self.subTest(path=name), self.on_path(overrides):
+                self.assertEqual(K.pct_change_batch([], []), [])
+
+
+class CorridorTest(KernelPathsMixin, unittest.TestCase):
+    PCTS = [5.0, 1.0, -1.0, 0.99, -0.99, 0.0, -7.5, 2.0]
+    THRESHOLD = 1.0
+
+    def test_states_and_actions_match_old_logic(self):
+        tickers = ["T%d" % i for i in range(len(self.PCTS))]
+        saved_values = ["up", "down", "none", None, "garbage"]  # None = kein Eintrag
+        for name, overrides in self.paths():
+            for saved in saved_values:
+                state = {} if saved is None else {tk: saved for tk in tickers}
+                with self.subTest(path=name, saved=saved), self.on_path(overrides):
+                    codes = K.classify_codes(self.PCTS, self.THRESHOLD)
+                    directions = K.decode_codes(codes)
+                    actions = K.corridor_actions(codes, K.encode_states(state, tickers))
+
+                    old_dirs = [_old_direction(p, self.THRESHOLD) for p in self.PCTS]
+                    prev = state.get(tickers[0], "none")
+                    self.assertEqual(directions, old_dirs)
+                    self.assertEqual(list(actions), [_old_action(d, prev) for d in old_dirs])
+
+    def test_unknown_state_breaks_out_or_resets(self):
+        # unbekannter gespeicherter Wert: Ausbruch alertet, Korridor setzt zurück
+        for name, overrides in self.paths():
+            with self.subTest(path=name), self.on_path(overrides):
+                prev = K.encode_states({"A": "sideways", "B": "sideways"}, ["A", "B"])
+                codes = K.classify_codes([3.0, 0.0], 1.0)
+                self.assertEqual(list(K.corridor_actions(codes, prev)), [K.BREAKOUT, K.RESET])
+
+
+class MarketHoursTest(unittest.TestCase):
+    CONFIGS = [
+        ("America/New_York", "09:30", "16:00", [1, 2, 3, 4, 5]),
+        ("Europe/Berlin", "00:00", "02:30", [7]),  # Fenster über die DST-Umstellung
+        ("Europe/Berlin", "01:15", "03:45", []),   # leer = alle Tage
+    ]
+    # je Zone die DST-Wechsel 2025 (Frühjahr/Herbst), Raster von 13 Minuten über 3 Tage
+    STARTS = [
+        dt.datetime(2025, 3, 8, tzinfo=dt.timezone.utc),
+        dt.datetime(2025, 3, 29, tzinfo=dt.timezone.utc),
+        dt.datetime(2025, 10, 25, tzinfo=dt.timezone.utc),
+        dt.datetime(2025, 11, 1, tzinfo=dt.timezone.utc),
+    ]
+
+    def _kernel_fns(self):
+        yield "mh_check", K.mh_check
+        py = getattr(K.mh_check, "py_func", None)  # numba: unkompilierte Python-Fassung
+        if py is not None:
+            yield "py_func", py
+
+    def _is_market_hours(self, ts, cfg):
+        with mock.patch.object(core, "time", mock.Mock(time=lambda: ts)):
+            return core.is_market_hours(cfg)
+
+    def test_matches_old_datetime_logic_across_dst(self):
+        for tz, open_s, close_s, days in self.CONFIGS:
+            cfg = {"timezone": tz, "open": open_s, "close": close_s,
+                   "active_days": days, "pause_on_closed": True}
+            zone = ZoneInfo(tz)
+            for start in self.STARTS:
+                base = int(start.timestamp()) + 7  # nicht nur auf Minutengrenzen
+                for step in range(3 * 24 * 60 // 13):
+                    ts = base + step * 13 * 60
+                    expected = _old_market_hours(dt.datetime.fromtimestamp(ts, zone), open_s, close_s, days)
+                    with self.subTest(tz=tz, ts=ts):
+                        self.assertEqual(self._is_market_hours(ts, cfg), expected)
+
+    def test_close_minute_is_inclusive(self):
+        zone = ZoneInfo("America/New_York")
+        open_min, close_min, mask, _pause = core._mh_derive("09:30", "16:00", (1, 2, 3, 4, 5), True)
+        close = dt.datetime(2025, 6, 10, 16, 0, tzinfo=zone)  # Dienstag
+        ts = int(close.timestamp())
+        offset = core._tz_offset_s("America/New_York", ts // 900)
+        for name, fn in self._kernel_fns():
+            with self.subTest(fn=name):
+                self.assertTrue(fn(ts, open_min, close_min, mask, offset))
+                self.assertFalse(fn(ts + 1, open_min, close_min, mask, offset))
+                self.assertTrue(fn(ts - (close_min - open_min) * 60, open_min, close_min, mask, offset))
+                self.assertFalse(fn(ts - (close_min - open_min) * 60 - 1, open_min, close_min, mask, offset))
+
+    def test_inactive_day(self):
+        zone = ZoneInfo("America/New_York")
+        open_min, close_min, mask, _pause = core._mh_derive("09:30", "16:00", (1, 2, 3, 4, 5), True)
+        saturday_noon = int(dt.datetime(2025, 6, 14, 12, 0, tzinfo=zone).timestamp())
+        offset = core._tz_offset_s("America/New_York", saturday_noon // 900)
+        for name, fn in self._kernel_fns():
+            with self.subTest(fn=name):
+                self.assertFalse(fn(saturday_noon, open_min, close_min, mask, offset))
+
+    def test_pause_off_is_always_open(self):
+        cfg = {"timezone": "America/New_York", "open": "09:30", "close": "16:00",
+               "active_days": [1], "pause_on_closed": False}
+        self.assertTrue(self._is_market_hours(0, cfg))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+import xml.etree.ElementTree as ET
+
+from src.app.news import _NS_SOURCE, _item_fields
+
+
+def _item(xml: str):
+    return ET.fromstring(f'<item xmlns:g="http://news.google.com">{xml}</item>')
+
+
+class ItemFieldsTest(unittest.TestCase):
+    def test_reads_all_fields(self):
+        f = _item_fields(_item(
+            "<title> Apple steigt </title><link>https://x/1</link>"
+            "<source>Reuters</source><pubDate>Mon, 13 Oct 2025 08:00:00 GMT</pubDate>"
+        ))
+        self.assertEqual(f, {
+            "title": "Apple steigt",
+            "link": "https://x/1",
+            "source": "Reuters",
+            "pubDate": "Mon, 13 Oct 2025 08:00:00 GMT",
+        })
+
+    def test_empty_source_falls_through_to_namespaced(self):
+        f = _item_fields(_item("<title>T</title><source/><g:source>Handelsblatt</g:source>"))
+        self.assertNotIn("source", f)
+        self.assertEqual(f.get("source") or f.get(_NS_SOURCE), "Handelsblatt")
+
+    def test_first_non_empty_value_per_tag(self):
+        f = _item_fields(_item("<title>  </title><title>Zweiter Titel</title><title>Dritter</title>"))
+        self.assertEqual(f["title"], "Zweiter Titel")
+
+    def test_missing_fields_are_absent(self):
+        self.assertEqual(_item_fields(_item("<description>x</description>")), {})
+
+
+if __name__ == "__main__":
+    unittest.main()